@@ -1,10 +1,26 @@
+import asyncio
+import base64
+import gzip
+import hashlib
+import importlib.util
+import io
+import json
 import logging
+import mmap
+import shutil
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from functools import partial, wraps
 from pathlib import PurePosixPath
-from typing import Any
+from typing import Any, ClassVar, NamedTuple
 
 import fsspec
+from fsspec.asyn import sync
+from fsspec.utils import infer_compression
 from kedro.io.core import (
+    AbstractDataset,
     AbstractVersionedDataset,
     DatasetError,
     Version,
@@ -12,13 +28,523 @@ from kedro.io.core import (
     get_protocol_and_path,
 )
 
+from fusion_datasets.filesystem import _options_hash, get_filesystem
+from fusion_datasets.utils import DirectoryCache, check_installed
+
 logger = logging.getLogger(__name__)
 
+AZURE_PROTOCOLS = ("abfs", "abfss", "az")
+S3_PROTOCOLS = ("s3", "s3a")
+# S3 rejects multipart uploads with parts, other than the last, smaller than 5 MiB
+S3_MIN_PART_SIZE = 5 * 1024 * 1024
+
+COMPRESSION_MODULES = {"gzip": "gzip", "zstd": "zstandard", "lz4": "lz4"}
+COMPRESSION_MAGIC = {
+    b"\x1f\x8b": "gzip",
+    b"\x28\xb5\x2f\xfd": "zstd",
+    b"\x04\x22\x4d\x18": "lz4",
+}
+
+
+def _detect_compression(header: bytes) -> str | None:
+    """Returns the codec whose magic number starts ``header``, or None."""
+    for magic, codec in COMPRESSION_MAGIC.items():
+        if header.startswith(magic):
+            return codec
+    return None
+
+
+def _compressor(codec: str, sink: Any, level: int | None, threads: int) -> Any:
+    """Returns a file-like object compressing what is written to it into ``sink``.
+
+    Closing it flushes the compressed stream but leaves ``sink`` open.
+    """
+    if codec == "gzip":
+        return gzip.GzipFile(fileobj=sink, mode="wb", compresslevel=6 if level is None else level)
+    if codec == "zstd":
+        import zstandard  # noqa: PLC0415
+
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level, threads=threads)
+        return compressor.stream_writer(sink, closefd=False)
+    import lz4.frame  # noqa: PLC0415
+
+    return lz4.frame.open(sink, mode="wb", compression_level=level or 0)
+
+
+def _decompressor(codec: str, source: Any) -> Any:
+    """Returns a file-like object decompressing ``source`` as it is read."""
+    if codec == "gzip":
+        return gzip.GzipFile(fileobj=source, mode="rb")
+    if codec == "zstd":
+        import zstandard  # noqa: PLC0415
+
+        return zstandard.ZstdDecompressor().stream_reader(source, closefd=False)
+    import lz4.frame  # noqa: PLC0415
+
+    return lz4.frame.open(source, mode="rb")
+
+
+def _compress_blocks(
+    blocks: Iterator[bytes], codec: str, level: int | None, threads: int
+) -> Iterator[bytes]:
+    """Compresses an iterable of blocks, yielding the compressed data as it is produced."""
+    sink = io.BytesIO()
+    with _compressor(codec, sink, level, threads) as writer:
+        for block in blocks:
+            writer.write(block)
+            if sink.tell():
+                yield sink.getvalue()
+                sink.seek(0)
+                sink.truncate()
+    if sink.tell():
+        yield sink.getvalue()
+
+
+def _iter_parts(data: Any, part_size: int) -> Iterator[bytes]:
+    """Splits bytes, a file-like object or an iterable of bytes into parts of ``part_size``."""
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        view = memoryview(data)
+        for start in range(0, len(view), part_size):
+            yield bytes(view[start : start + part_size])
+    elif hasattr(data, "read"):
+        while part := data.read(part_size):
+            yield part
+    else:
+        buffer = bytearray()
+        for block in data:
+            buffer += block
+            while len(buffer) >= part_size:
+                yield bytes(buffer[:part_size])
+                del buffer[:part_size]
+        if buffer:
+            yield bytes(buffer)
+
+
+def _hasher(algorithm: str | None) -> tuple[str, Any]:
+    """Returns the name of a hash algorithm and a new hash object using it.
+
+    ``algorithm`` is ``xxh3_128`` or any algorithm of ``hashlib``. If it is None,
+    ``xxh3_128`` is used if xxHash is installed, and a 128-bit BLAKE2 otherwise.
+    """
+    if algorithm is None:
+        algorithm = "xxh3_128" if importlib.util.find_spec("xxhash") else "blake2b"
+    if algorithm == "xxh3_128":
+        import xxhash  # noqa: PLC0415
+
+        return algorithm, xxhash.xxh3_128()
+    if algorithm == "blake2b":
+        return algorithm, hashlib.blake2b(digest_size=16)
+    return algorithm, hashlib.new(algorithm)
+
+
+def _content_digest(data: bytes, algorithm: str = None) -> str:
+    """Hashes ``data``, see ``_hasher``.
+
+    The digest is prefixed with the name of the algorithm, so digests computed with
+    different algorithms never compare equal.
+    """
+    name, hasher = _hasher(algorithm)
+    hasher.update(data)
+    return f"{name}:{hasher.hexdigest()}"
+
+
+def _hashing_blocks(blocks: Iterator[bytes], hasher: Any) -> Iterator[bytes]:
+    """Passes the blocks through, updating ``hasher`` with each of them."""
+    for block in blocks:
+        hasher.update(block)
+        yield block
+
+
+FINGERPRINT_FIELDS = (
+    "ETag",
+    "etag",
+    "VersionId",
+    "version_id",
+    "LastModified",
+    "last_modified",
+    "mtime",
+    "created",
+)
+
+
+def _fingerprint(info: dict[str, Any]) -> dict[str, str]:
+    """Returns the metadata of a file that changes with its content, e.g. its ETag."""
+    return {name: str(info[name]) for name in FINGERPRINT_FIELDS if info.get(name)}
+
+
+def _backend_md5(info: dict[str, Any]) -> str | None:
+    """Returns the hex MD5 of a file's content from its metadata, if the backend stores it."""
+    content_md5 = (info.get("content_settings") or {}).get("content_md5")  # Azure
+    if content_md5:
+        return bytes(content_md5).hex()
+    if info.get("md5Hash"):  # GCS
+        return base64.b64decode(info["md5Hash"]).hex()
+    etag = str(info.get("ETag") or info.get("etag") or "").strip('"')
+    # the ETag of a single-part S3 upload is the MD5 of its content
+    if len(etag) == 32 and all(char in "0123456789abcdef" for char in etag):  # noqa: PLR2004
+        return etag
+    return None
+
+
+async def _next_part(parts: Iterator[bytes]) -> bytes | None:
+    # reading the source may block, so keep it off the filesystem's event loop
+    return await asyncio.get_running_loop().run_in_executor(None, next, parts, None)
+
+
+async def _gather_parts(tasks: list[asyncio.Task]) -> None:
+    """Waits for the part uploads in flight, then raises the first error of a failed one."""
+    for result in await asyncio.gather(*tasks, return_exceptions=True):
+        if isinstance(result, BaseException):
+            raise result
+
+
+async def _upload_blocks_azure(
+    fs: fsspec.AbstractFileSystem,
+    path: str,
+    parts: Iterator[bytes],
+    max_workers: int,
+    resume: bool,
+) -> None:
+    """Stages the parts as blocks of an Azure block blob concurrently, then commits them.
+
+    Block ids are derived from the part index and content, so when ``resume`` is set the
+    blocks left uncommitted by a failed upload of the same data are not staged again.
+    """
+    from azure.core.exceptions import ResourceNotFoundError  # noqa: PLC0415
+    from azure.storage.blob import BlobBlock  # noqa: PLC0415
+
+    container, blob, _ = fs.split_path(path)
+    async with fs.service_client.get_blob_client(container, blob) as client:
+        staged: set[str] = set()
+        if resume:
+            try:
+                _, uncommitted = await client.get_block_list("uncommitted")
+                staged = {block.id for block in uncommitted}
+            except ResourceNotFoundError:
+                pass
+
+        semaphore = asyncio.Semaphore(max_workers)
+        failed = asyncio.Event()
+        block_ids: list[str] = []
+        tasks = []
+
+        async def _stage(block_id: str, part: bytes) -> None:
+            try:
+                await client.stage_block(block_id, part, length=len(part))
+            except BaseException:
+                failed.set()
+                raise
+            finally:
+                semaphore.release()
+
+        index = 0
+        while (part := await _next_part(parts)) is not None:
+            digest = hashlib.blake2b(part, digest_size=8).hexdigest()
+            # all the block ids of a blob must have the same length
+            block_id = f"{index:06d}-{digest}"
+            block_ids.append(block_id)
+            index += 1
+            if block_id in staged:
+                continue
+            await semaphore.acquire()
+            if failed.is_set():
+                break
+            tasks.append(asyncio.create_task(_stage(block_id, part)))
+        await _gather_parts(tasks)
+        if staged:
+            logger.info("Resumed the upload of '%s' from staged blocks.", path)
+        await client.commit_block_list([BlobBlock(block_id=i) for i in block_ids])
+
+
+async def _pending_s3_upload(
+    fs: fsspec.AbstractFileSystem, bucket: str, key: str
+) -> tuple[str | None, dict[int, str]]:
+    """Returns the id of the latest pending multipart upload of a key and its part ETags.
+
+    The ETags are keyed by part number. Without a pending upload, the id is None.
+    """
+    pending = await fs._call_s3("list_multipart_uploads", Bucket=bucket, Prefix=key)
+    uploads = [u for u in pending.get("Uploads", []) if u["Key"] == key]
+    if not uploads:
+        return None, {}
+
+    upload_id = max(uploads, key=lambda u: u["Initiated"])["UploadId"]
+    uploaded, marker = {}, 0
+    while True:
+        listing = await fs._call_s3(
+            "list_parts",
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            PartNumberMarker=marker,
+        )
+        for part in listing.get("Parts", []):
+            uploaded[part["PartNumber"]] = part["ETag"]
+        if not listing.get("IsTruncated"):
+            return upload_id, uploaded
+        marker = listing["NextPartNumberMarker"]
+
+
+async def _start_s3_upload(
+    fs: fsspec.AbstractFileSystem, bucket: str, key: str, resume: bool
+) -> tuple[str, dict[int, str]]:
+    """Returns the id of the multipart upload to send the parts to and the uploaded ETags.
+
+    When ``resume`` is set, the pending upload of the key is continued if there is one;
+    otherwise a new upload is created, with no uploaded parts.
+    """
+    upload_id, uploaded = None, {}
+    if resume:
+        upload_id, uploaded = await _pending_s3_upload(fs, bucket, key)
+    if upload_id is None:
+        created = await fs._call_s3("create_multipart_upload", Bucket=bucket, Key=key)
+        upload_id = created["UploadId"]
+    return upload_id, uploaded
+
+
+async def _abort_s3_upload(
+    fs: fsspec.AbstractFileSystem, bucket: str, key: str, upload_id: str
+) -> None:
+    # without resuming, the uploaded parts would stay stored, and billed, until aborted
+    try:
+        await fs._call_s3("abort_multipart_upload", Bucket=bucket, Key=key, UploadId=upload_id)
+    except Exception:
+        logger.warning("Could not abort the multipart upload of '%s'.", key, exc_info=True)
+
+
+async def _upload_parts_s3(
+    fs: fsspec.AbstractFileSystem,
+    path: str,
+    parts: Iterator[bytes],
+    max_workers: int,
+    resume: bool,
+) -> None:
+    """Uploads the parts of an S3 multipart upload concurrently, then completes it.
+
+    When ``resume`` is set, a pending multipart upload of the same key is continued, and
+    parts whose ETag matches the MD5 of the data are not uploaded again.
+    """
+    bucket, key, _ = fs.split_path(path)
+    first_part = await _next_part(parts)
+    if first_part is None:
+        # a multipart upload needs at least one part
+        await fs._pipe_file(path, b"")
+        return
+
+    upload_id, uploaded = await _start_s3_upload(fs, bucket, key, resume)
+
+    semaphore = asyncio.Semaphore(max_workers)
+    failed = asyncio.Event()
+    etags: dict[int, str] = {}
+    tasks = []
+
+    async def _upload(number: int, part: bytes) -> None:
+        try:
+            response = await fs._call_s3(
+                "upload_part",
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=number,
+                Body=part,
+            )
+            etags[number] = response["ETag"]
+        except BaseException:
+            failed.set()
+            raise
+        finally:
+            semaphore.release()
+
+    try:
+        number, part = 1, first_part
+        while part is not None:
+            etag = f'"{hashlib.md5(part).hexdigest()}"'
+            if uploaded.get(number) == etag:
+                etags[number] = etag
+            else:
+                await semaphore.acquire()
+                if failed.is_set():
+                    break
+                tasks.append(asyncio.create_task(_upload(number, part)))
+            number += 1
+            part = await _next_part(parts)
+        await _gather_parts(tasks)
+        await fs._call_s3(
+            "complete_multipart_upload",
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": [{"PartNumber": n, "ETag": etags[n]} for n in sorted(etags)]},
+        )
+    except BaseException:
+        if not resume:
+            await _abort_s3_upload(fs, bucket, key, upload_id)
+        raise
+
+
+class _LocalCache(DirectoryCache):
+    """Local directory caching the content of remote files.
+
+    Entries are keyed by the remote path, the metadata that changes with its content
+    (ETag, modification time, version id and size) and the compression the content is
+    loaded with, so validating an entry only takes a metadata request. The least recently
+    used entries are evicted once the cache grows over ``max_bytes``.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 10 << 30) -> None:
+        super().__init__(path, max_bytes)
+
+    def key(
+        self, protocol: str, path: str, info: dict[str, Any], compression: str | None
+    ) -> str | None:
+        fingerprint = _fingerprint(info)
+        if not fingerprint:
+            # without any metadata tracking the content, an entry could never be validated
+            return None
+        fingerprint.update(
+            protocol=protocol,
+            path=path,
+            size=str(info.get("size")),
+            compression=str(compression),
+        )
+        encoded = json.dumps(fingerprint, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+
+class _DigestedData(NamedTuple):
+    """Data to save, with the digest computed when checking whether it is unchanged."""
+
+    data: Any
+    digest: str
+
+
+class _ClosingReader(io.RawIOBase):
+    """Reader over a decompressed stream that also closes the underlying file."""
+
+    def __init__(self, reader: Any, fs_file: Any) -> None:
+        super().__init__()
+        self._reader = reader
+        self._fs_file = fs_file
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        return self._reader.read(size)
+
+    def readinto(self, buffer: Any) -> int:
+        data = self._reader.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._reader.close()
+            self._fs_file.close()
+        super().close()
+
+
+class BinaryBlockReader:
+    """Lazy reader over a file, returned by ``BinaryDataset`` when loading with
+    ``stream: True``.
+
+    Nothing is read until the reader is iterated; each iteration opens the file and yields
+    blocks of ``block_size`` bytes, so memory use does not depend on the file size. The
+    reader can also be saved with another ``BinaryDataset`` to copy the file block by block.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        fs: fsspec.AbstractFileSystem,
+        path: str,
+        block_size: int,
+        open_args: dict[str, Any] = None,
+        *,
+        compression: str = None,
+        expected_digest: str = None,
+    ) -> None:
+        self._fs = fs
+        self._path = path
+        self.block_size = block_size
+        self._open_args = open_args or {"mode": "rb"}
+        self.compression = compression
+        self.expected_digest = expected_digest
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Yields the blocks of the file.
+
+        If the reader has an ``expected_digest``, the blocks are hashed as they are read
+        and a ``DatasetError`` is raised once the whole file was read if they do not
+        match it.
+        """
+        hasher = None
+        if self.expected_digest is not None:
+            algorithm, hasher = _hasher(self.expected_digest.split(":", 1)[0])
+        with self.open() as fs_file:
+            while block := fs_file.read(self.block_size):
+                if hasher is not None:
+                    hasher.update(block)
+                yield block
+        if hasher is not None and f"{algorithm}:{hasher.hexdigest()}" != self.expected_digest:
+            raise DatasetError(
+                f"Checksum mismatch for '{self._path}': expected {self.expected_digest}, "
+                f"got {algorithm}:{hasher.hexdigest()}."
+            )
+
+    def open(self) -> Any:
+        """Opens the underlying file for reading, e.g. to pass it to ``shutil`` or ``zipfile``.
+
+        The file is decompressed as it is read if the reader has a ``compression`` codec.
+        """
+        fs_file = self._fs.open(self._path, **self._open_args)
+        if self.compression is None:
+            return fs_file
+        return _ClosingReader(_decompressor(self.compression, fs_file), fs_file)
+
+    def read_all(self) -> bytes:
+        """Reads the whole file at once."""
+        return b"".join(self)
+
 
 class BinaryDataset(AbstractVersionedDataset[bytes, bytes]):
     """``BinaryDataset`` loads/saves data from/to an arbitrary file using an underlying
     filesystem (e.g.: local, S3, GCS). It will return bytes disregarding the file type.
 
+    With ``stream: True`` in ``load_args``, a load returns a ``BinaryBlockReader`` that
+    yields the file in blocks instead. Besides bytes, saves accept an iterable of bytes
+    (such as a ``BinaryBlockReader``) or a file-like object, which are written block by
+    block, so large files can be copied between stores at constant memory. Local files can
+    be loaded with ``mmap: True`` as a read-only ``memoryview`` over a memory map of the
+    file, which is not copied into memory. With ``parallel: True``, a remote file is
+    downloaded by concurrent byte-range requests into a single ``bytearray``, which is
+    returned without copying it. ``offset`` and ``length`` in ``load_args`` load only a
+    slice of the file, and ``read_range`` reads any slice on demand, without downloading
+    the whole file. Remote files loaded whole can be kept in a local ``cache`` directory,
+    so they are downloaded again only when they change.
+
+    On Azure Blob Storage and S3, ``multipart: True`` in ``save_args`` uploads large files
+    as parts sent concurrently, and resumes a failed upload of the same data. With
+    ``skip_unchanged: True``, saving the same bytes as the stored file is skipped.
+
+    Files can be compressed with gzip, zstd or lz4 by setting ``compression`` in
+    ``save_args``, and decompressed by setting it in ``load_args``; both stream the data
+    block by block.
+
+    ``aload`` and ``asave`` load and save from a coroutine without blocking the event loop:
+    through the native coroutines of asynchronous filesystems such as S3, GCS, Azure Blob
+    Storage or HTTP, and in a thread on the others.
+
+    Resolving the latest version of a versioned dataset lists all its versions. With
+    ``latest_pointer: True`` in ``save_args``, each save also records its version in a
+    ``LATEST`` file next to the versions. Loads with ``latest_pointer: True`` in
+    ``load_args`` read that file instead of listing the versions. With
+    ``memoize_version: True`` in ``load_args``, the resolved version is kept until the
+    dataset is released.
+
+    With ``checksum`` in ``save_args``, a digest of the data is computed as it is written
+    and stored next to the file in a ``.digest`` file, and loads with ``verify_checksum:
+    True`` in ``load_args`` check the data against it as it is read.
+
     .. code-block:: yaml
 
         cars:
@@ -28,8 +554,62 @@ class BinaryDataset(AbstractVersionedDataset[bytes, bytes]):
             project: my-project
           credentials: my_gcp_credentials
 
+        model_archive:
+          type: BinaryDataset
+          filepath: abfs://models/archive.tar
+          load_args:
+            stream: true
+            block_size: 16777216
+          save_args:
+            multipart: true
+            part_size: 33554432
+            max_workers: 8
+          credentials: my_azure_credentials
+
+        embeddings:
+          type: BinaryDataset
+          filepath: s3://your_bucket/embeddings.npy
+          load_args:
+            cache:
+              path: /tmp/kedro-binary-cache
+              max_bytes: 10737418240
+          credentials: my_aws_credentials
+
     """
 
+    DEFAULT_LOAD_ARGS: dict[str, Any] = {
+        "stream": False,
+        "block_size": 8 * 1024 * 1024,
+        "mmap": False,
+        "parallel": False,
+        "range_size": 8 * 1024 * 1024,
+        "max_workers": 8,
+        "offset": None,
+        "length": None,
+        "compression": None,
+        "latest_pointer": False,
+        "memoize_version": False,
+        "verify_checksum": False,
+    }
+    DEFAULT_SAVE_ARGS: dict[str, Any] = {
+        "block_size": 8 * 1024 * 1024,
+        "multipart": False,
+        "part_size": 8 * 1024 * 1024,
+        "max_workers": 8,
+        "resume": True,
+        "skip_unchanged": False,
+        "compression": None,
+        "compression_level": None,
+        "compression_threads": 0,
+        "latest_pointer": False,
+        "checksum": None,
+    }
+    LATEST_POINTER = "LATEST"
+
+    # latest versions resolved in this process, by protocol, filesystem options and filepath
+    _resolved_versions: ClassVar[dict[tuple[str, str, str], str]] = {}
+    _resolved_versions_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(  # noqa: PLR0913
         self,
         *,
@@ -38,6 +618,8 @@ class BinaryDataset(AbstractVersionedDataset[bytes, bytes]):
         credentials: dict[str, Any] = None,
         fs_args: dict[str, Any] = None,
         metadata: dict[str, Any] = None,
+        load_args: dict[str, Any] = None,
+        save_args: dict[str, Any] = None,
     ) -> None:
         """Creates a new instance of ``BinaryDataset`` pointing to an arbitrary concrete file
         on a specific filesystem.
@@ -63,6 +645,59 @@ class BinaryDataset(AbstractVersionedDataset[bytes, bytes]):
                 and to `w` when saving.
             metadata: Any arbitrary metadata.
                 This is ignored by Kedro, but may be consumed by users or external plugins.
+            load_args: Options for loading.
+                ``stream``: if True, return a ``BinaryBlockReader`` instead of bytes, which
+                yields the file in blocks or reads it whole with ``read_all``. Defaults to
+                False.
+                ``block_size``: bytes per block of a streamed load. Defaults to 8 MiB.
+                ``mmap``: if True, return a read-only ``memoryview`` of the memory-mapped
+                file instead of a copy of its bytes. Local files only. Defaults to False.
+                ``parallel``: if True, download the file as byte ranges of ``range_size``
+                bytes (defaults to 8 MiB), fetched by up to ``max_workers`` (defaults to
+                8) concurrent requests. Defaults to False.
+                ``offset`` and ``length``: load only ``length`` bytes starting at
+                ``offset``. A negative offset counts from the end of the file, and a
+                missing length reads to the end.
+                ``cache``: a dict with the ``path`` of a local directory where remote
+                files loaded whole are cached, and its ``max_bytes`` (defaults to 10 GiB)
+                before the least recently used files are evicted. Cached files are
+                validated with the ETag, modification time or version of the remote file.
+                ``compression``: ``gzip``, ``zstd`` or ``lz4`` to decompress the file, or
+                ``infer`` to detect the codec from the magic number at the start of the
+                file, then from the file extension. Defaults to None, which loads the
+                stored bytes as they are.
+                ``latest_pointer``: if True, resolve the latest version from the
+                ``LATEST`` file written by saves, falling back to listing the versions if
+                it is missing or points to a missing version. Defaults to False.
+                ``memoize_version``: if True, keep the resolved latest version, shared by
+                the datasets of the same file and updated by their saves, until one of
+                them is released. Defaults to False.
+                ``verify_checksum``: if True, check the loaded data against the digest
+                stored by a save with ``checksum``, and raise a ``DatasetError`` if they
+                differ. Streamed loads are checked once the whole file was read; ``mmap``
+                and range loads are not checked. Defaults to False.
+            save_args: Options for saving.
+                ``block_size``: bytes per block written when saving an iterable or a
+                file-like object. Defaults to 8 MiB.
+                ``multipart``: if True, split the data into parts of ``part_size`` bytes
+                (defaults to 8 MiB, and at least 5 MiB on S3), uploaded by up to
+                ``max_workers`` (defaults to 8) concurrent requests, then committed.
+                Azure Blob Storage and S3 only. Defaults to False.
+                ``resume``: if True, reuse the parts of a previous failed multipart upload
+                of the same data. Defaults to True.
+                ``skip_unchanged``: if True, skip saving bytes that match the latest stored
+                file, compared with a digest kept next to it in a ``.digest`` file or with
+                the MD5 stored by the backend. Defaults to False.
+                ``compression``: ``gzip``, ``zstd`` or ``lz4`` to compress the file, or
+                ``infer`` to pick the codec from the file extension. Defaults to None.
+                ``compression_level``: defaults to 6 for gzip, 3 for zstd and 0 for lz4.
+                ``compression_threads``: zstd worker threads, -1 for one per CPU core.
+                Defaults to 0, which compresses in the calling thread.
+                ``latest_pointer``: if True, record the saved version in a ``LATEST`` file
+                next to the versions. Defaults to False.
+                ``checksum``: hash algorithm, such as ``sha256`` or ``xxh3_128``, of a
+                digest of the data computed as it is written and stored in a ``.digest``
+                file next to it. Defaults to None.
         """
         _fs_args = deepcopy(fs_args) or {}
         _fs_open_args_load = _fs_args.pop("open_args_load", {})
@@ -74,7 +709,7 @@ class BinaryDataset(AbstractVersionedDataset[bytes, bytes]):
         self._protocol = protocol
         if protocol == "file":
             _fs_args.setdefault("auto_mkdir", True)
-        self._fs = fsspec.filesystem(self._protocol, **_credentials, **_fs_args)
+        self._fs = get_filesystem(self._protocol, _credentials, _fs_args)
 
         self.metadata = metadata
 
@@ -84,33 +719,529 @@ class BinaryDataset(AbstractVersionedDataset[bytes, bytes]):
             exists_function=self._fs.exists,
             glob_function=self._fs.glob,
         )
+        # the same path on another account or endpoint is another file
+        self._resolved_versions_key = (
+            protocol,
+            _options_hash(_credentials, _fs_args),
+            str(self._filepath),
+        )
 
         _fs_open_args_save.update({"mode": "wb"})
         _fs_open_args_load.update({"mode": "rb"})
         self._fs_open_args_load = _fs_open_args_load
         self._fs_open_args_save = _fs_open_args_save
+        self._load_args = {**self.DEFAULT_LOAD_ARGS, **(load_args or {})}
+        cache = self._load_args.pop("cache", None)
+        if cache and protocol == "file":
+            logger.warning("'cache' only applies to remote files and is ignored for local files.")
+            cache = None
+        if cache and self._load_args["stream"]:
+            logger.warning("'cache' does not apply to streamed loads and is ignored.")
+            cache = None
+        self._local_cache = _LocalCache(**cache) if cache else None
+        if self._load_args["mmap"] and protocol != "file":
+            logger.warning(
+                "'mmap' only applies to local files and is ignored for protocol '%s'.",
+                protocol,
+            )
+            self._load_args["mmap"] = False
+        self._save_args = {**self.DEFAULT_SAVE_ARGS, **(save_args or {})}
+        if self._save_args["multipart"] and protocol not in AZURE_PROTOCOLS + S3_PROTOCOLS:
+            logger.warning(
+                "'multipart' is only supported on Azure Blob Storage and S3 and is "
+                "ignored for protocol '%s'.",
+                protocol,
+            )
+            self._save_args["multipart"] = False
+        if (
+            self._save_args["multipart"]
+            and protocol in S3_PROTOCOLS
+            and self._save_args["part_size"] < S3_MIN_PART_SIZE
+        ):
+            raise ValueError(
+                f"'part_size' must be at least {S3_MIN_PART_SIZE} bytes for multipart "
+                f"uploads to S3, got {self._save_args['part_size']}."
+            )
+        if self._save_args["compression"] == "infer":
+            # extensions of codecs that are not supported, e.g. ``.zip``, save uncompressed
+            codec = infer_compression(path)
+            self._save_args["compression"] = codec if codec in COMPRESSION_MODULES else None
+        self._validate_codecs()
+
+    def _validate_codecs(self) -> None:
+        for args in (self._load_args, self._save_args):
+            codec = args["compression"]
+            if codec not in (None, "infer", *COMPRESSION_MODULES):
+                raise ValueError(
+                    f"Unsupported compression {codec!r}, "
+                    f"expected one of {sorted(COMPRESSION_MODULES)} or 'infer'."
+                )
+            if codec in COMPRESSION_MODULES:
+                check_installed(COMPRESSION_MODULES[codec], "compression")
+        checksum = self._save_args["checksum"]
+        if checksum == "xxh3_128":
+            check_installed("xxhash", "checksum")
+        elif checksum is not None and checksum not in hashlib.algorithms_available:
+            raise ValueError(
+                f"Unsupported checksum {checksum!r}, expected 'xxh3_128' or one of "
+                f"{sorted(hashlib.algorithms_available)}."
+            )
+        if self._load_args["compression"] and (
+            self._load_args["mmap"]
+            or self._load_args["offset"] is not None
+            or self._load_args["length"] is not None
+        ):
+            raise ValueError(
+                "'compression' cannot be combined with 'mmap', 'offset' or 'length', "
+                "which address the stored bytes."
+            )
 
     def _describe(self) -> dict[str, Any]:
         return {
             "filepath": self._filepath,
             "protocol": self._protocol,
             "version": self._version,
+            "load_args": self._load_args,
+            "save_args": self._save_args,
         }
 
     def _load(self) -> Any:
         load_path = get_filepath_str(self._get_load_path(), self._protocol)
 
+        offset, length = self._load_args["offset"], self._load_args["length"]
+        is_range = offset is not None or length is not None
+
+        if self._load_args["mmap"]:
+            view = self._load_mmap(load_path)
+            return view[self._slice(offset, length)] if is_range else view
+
+        if is_range:
+            return self._read_range(load_path, offset, length)
+
+        if self._load_args["stream"]:
+            return BinaryBlockReader(
+                self._fs,
+                load_path,
+                self._load_args["block_size"],
+                self._fs_open_args_load,
+                compression=self._load_compression(load_path),
+                expected_digest=(
+                    self._expected_digest(load_path) if self._load_args["verify_checksum"] else None
+                ),
+            )
+
+        if self._local_cache is not None:
+            data = self._load_cached(load_path)
+        else:
+            data = self._load_bytes(load_path)
+
+        if self._load_args["verify_checksum"]:
+            self._verify_checksum(load_path, data)
+        return data
+
+    def _expected_digest(self, load_path: str) -> str | None:
+        stored = self._stored_digest(load_path)
+        if stored is None:
+            logger.warning("No checksum is stored for '%s', it is not verified.", load_path)
+            return None
+        return stored[0]
+
+    def _verify_checksum(self, load_path: str, data: bytes) -> None:
+        expected = self._expected_digest(load_path)
+        if expected is None:
+            return
+        actual = _content_digest(data, expected.split(":", 1)[0])
+        if actual != expected:
+            raise DatasetError(
+                f"Checksum mismatch for '{load_path}': expected {expected}, got {actual}."
+            )
+
+    async def aload(self) -> Any:
+        """Loads the data from a coroutine, without blocking the event loop.
+
+        Whole files and ranges are fetched with the coroutines of asynchronous
+        filesystems, so many loads can run concurrently from one event loop. Other loads,
+        and loads from synchronous filesystems, run ``load`` in the default executor.
+
+        Returns:
+            The loaded data, as returned by ``load``.
+        """
+        loop = asyncio.get_running_loop()
+        if not self._fs.async_impl or (
+            self._load_args["mmap"]
+            or self._load_args["stream"]
+            or self._load_args["parallel"]
+            or self._local_cache is not None
+        ):
+            return await loop.run_in_executor(None, self.load)
+
+        self._logger.debug("Loading %s", str(self))
+        try:
+            # resolving the latest version may list the versions, so keep it off the loop
+            load_path = await loop.run_in_executor(
+                None, lambda: get_filepath_str(self._get_load_path(), self._protocol)
+            )
+            offset, length = self._load_args["offset"], self._load_args["length"]
+            if offset is not None or length is not None:
+                range_slice = self._slice(offset, length)
+                return await self._run_on_fs_loop(
+                    self._fs._cat_file(load_path, start=range_slice.start, end=range_slice.stop)
+                )
+            data = await self._run_on_fs_loop(self._fs._cat_file(load_path))
+            if self._load_args["compression"] is not None:
+                data = await loop.run_in_executor(None, self._decompress, load_path, data)
+            if self._load_args["verify_checksum"]:
+                await loop.run_in_executor(None, self._verify_checksum, load_path, data)
+            return data
+        except DatasetError:
+            raise
+        except Exception as exc:
+            raise DatasetError(f"Failed while loading data from dataset {self!s}.\n{exc}") from exc
+
+    async def asave(self, data: Any) -> None:
+        """Saves the data from a coroutine, without blocking the event loop.
+
+        Bytes are written with the coroutines of asynchronous filesystems, so many saves
+        can run concurrently from one event loop. Iterables, file-like objects, multipart
+        uploads, saves skipping unchanged content or storing a checksum, as well as saves
+        to synchronous filesystems, run ``save`` in the default executor.
+
+        Args:
+            data: The data to save, as accepted by ``save``.
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            not self._fs.async_impl
+            or not isinstance(data, (bytes, bytearray, memoryview))
+            or self._save_args["multipart"]
+            or self._save_args["skip_unchanged"]
+            or self._save_args["checksum"] is not None
+        ):
+            await loop.run_in_executor(None, self.save, data)
+            return
+
+        self._logger.debug("Saving %s", str(self))
+        try:
+            self._clear_resolved_versions()
+            save_path = await loop.run_in_executor(
+                None, lambda: get_filepath_str(self._get_save_path(), self._protocol)
+            )
+            if self._save_args["compression"]:
+                data = await loop.run_in_executor(None, self._compress, data)
+            await self._run_on_fs_loop(self._fs._pipe_file(save_path, bytes(data)))
+            await loop.run_in_executor(None, self._record_version, save_path)
+            self._invalidate_cache()
+        except DatasetError:
+            raise
+        except Exception as exc:
+            raise DatasetError(f"Failed while saving data to dataset {self!s}.\n{exc}") from exc
+
+    def _clear_resolved_versions(self) -> None:
+        # as ``save`` does; kedro 1.0 replaced the version cache with attributes
+        if hasattr(self, "_clear_version_cache"):
+            self._clear_version_cache()
+        else:
+            self._version_cache.clear()
+
+    async def _run_on_fs_loop(self, coro: Any) -> Any:
+        # the filesystem's clients are bound to its own event loop, which runs in a thread
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self._fs.loop))
+
+    def _compress(self, data: bytes) -> bytes:
+        return b"".join(
+            _compress_blocks(
+                _iter_parts(data, self._save_args["block_size"]),
+                self._save_args["compression"],
+                self._save_args["compression_level"],
+                self._save_args["compression_threads"],
+            )
+        )
+
+    def _load_bytes(self, load_path: str) -> bytes:
+        if self._load_args["parallel"]:
+            return self._decompress(load_path, self._load_ranges(load_path))
+
         with self._fs.open(load_path, **self._fs_open_args_load) as fs_file:
-            return fs_file.read()
+            codec = self._load_args["compression"]
+            if codec == "infer":
+                codec = self._infer_compression(load_path, fs_file.read(4))
+                fs_file.seek(0)
+            if codec is None:
+                return fs_file.read()
+            with _decompressor(codec, fs_file) as reader:
+                return reader.read()
+
+    def _load_compression(self, load_path: str) -> str | None:
+        codec = self._load_args["compression"]
+        if codec == "infer":
+            with self._fs.open(load_path, **self._fs_open_args_load) as fs_file:
+                codec = self._infer_compression(load_path, fs_file.read(4))
+        return codec
+
+    @staticmethod
+    def _infer_compression(load_path: str, header: bytes) -> str | None:
+        codec = _detect_compression(header) or infer_compression(load_path)
+        return codec if codec in COMPRESSION_MODULES else None
+
+    def _decompress(self, load_path: str, data: bytes) -> bytes:
+        codec = self._load_args["compression"]
+        if codec == "infer":
+            codec = self._infer_compression(load_path, data[:4])
+        if codec is None:
+            return data
+        with _decompressor(codec, io.BytesIO(data)) as reader:
+            return reader.read()
+
+    def _load_cached(self, load_path: str) -> bytes:
+        info = self._fs.info(load_path)
+        key = self._local_cache.key(self._protocol, load_path, info, self._load_args["compression"])
+        if key is None:
+            return self._load_bytes(load_path)
+
+        data = self._local_cache.get(key)
+        if data is None:
+            data = self._load_bytes(load_path)
+            # a size mismatch means the file changed after its metadata was read
+            size = None if self._load_args["compression"] else info.get("size")
+            if size is None or len(data) == size:
+                self._local_cache.put(key, data)
+        return data
+
+    def read_range(self, offset: int, length: int = None) -> bytes:
+        """Reads a slice of the file without downloading the rest of it.
+
+        Args:
+            offset: Position of the first byte to read. A negative offset counts from the
+                end of the file, e.g. ``-8`` for the last 8 bytes.
+            length: Number of bytes to read. Reads to the end of the file if None.
+
+        Returns:
+            The bytes in the range, which may be fewer than ``length`` at the end of the file.
+        """
+        load_path = get_filepath_str(self._get_load_path(), self._protocol)
+        return self._read_range(load_path, offset, length)
+
+    def _read_range(self, load_path: str, offset: int | None, length: int | None) -> bytes:
+        range_slice = self._slice(offset, length)
+        return self._fs.cat_file(load_path, start=range_slice.start, end=range_slice.stop)
+
+    @staticmethod
+    def _slice(offset: int | None, length: int | None) -> slice:
+        start = offset or 0
+        if length is None:
+            return slice(start, None)
+        if start < 0 and start + length >= 0:
+            # the range reaches the end of the file
+            return slice(start, None)
+        return slice(start, start + length)
+
+    def _load_ranges(self, load_path: str) -> bytearray:
+        size = self._fs.size(load_path)
+        range_size = self._load_args["range_size"]
+        buffer = bytearray(size)
+
+        def _fetch(start: int) -> None:
+            end = min(start + range_size, size)
+            data = self._fs.cat_file(load_path, start=start, end=end)
+            if len(data) != end - start:
+                raise DatasetError(
+                    f"Expected {end - start} bytes at offset {start} of '{load_path}', "
+                    f"got {len(data)}. The file may have changed during the load."
+                )
+            buffer[start:end] = data
+
+        with ThreadPoolExecutor(max_workers=self._load_args["max_workers"]) as executor:
+            # consume the results so that the first failed range is raised
+            list(executor.map(_fetch, range(0, size, range_size)))
+        # not converted to bytes, which would copy the whole file
+        return buffer
+
+    @staticmethod
+    def _load_mmap(load_path: str) -> memoryview:
+        with open(load_path, "rb") as local_file:
+            try:
+                # the map keeps its own handle on the file once created
+                mapped = mmap.mmap(local_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty files cannot be mapped
+                return memoryview(b"")
+        return memoryview(mapped)
+
+    def save(self, data: bytes) -> None:
+        # used by the versions of kedro without ``_save_wrapper``, e.g. 0.19.1
+        self._save_unless_unchanged(super().save, data)
+
+    @classmethod
+    def _save_wrapper(cls, save_func: Callable[[Any, Any], None]) -> Callable[[Any, Any], None]:
+        kedro_save = super()._save_wrapper(save_func)
+
+        @wraps(save_func)
+        def save(self: "BinaryDataset", data: Any) -> None:
+            self._save_unless_unchanged(partial(kedro_save, self), data)
+
+        save.__savewrapped__ = True
+        return save
+
+    def _save_unless_unchanged(self, save: Callable[[Any], None], data: Any) -> None:
+        # checked before kedro's save, which would warn that the latest version is not the
+        # save version, as a save of unchanged content creates no version
+        if not self._save_args["skip_unchanged"] or not isinstance(
+            data, (bytes, bytearray, memoryview)
+        ):
+            save(data)
+            return
+        try:
+            digest = _content_digest(data, self._save_args["checksum"])
+            unchanged = self._is_unchanged(data, digest)
+        except DatasetError:
+            raise
+        except Exception as exc:
+            raise DatasetError(f"Failed while saving data to dataset {self!s}.\n{exc}") from exc
+        if unchanged:
+            logger.info("Skipped saving '%s', its content is unchanged.", self._filepath)
+            return
+        save(_DigestedData(data, digest))
 
     def _save(self, data: Any) -> None:
+        digest, hasher = None, None
+        checksum = self._save_args["checksum"]
+        if isinstance(data, _DigestedData):
+            data, digest = data
+        elif isinstance(data, (bytes, bytearray, memoryview)):
+            if checksum is not None:
+                digest = _content_digest(data, checksum)
+        elif checksum is not None:
+            # hash the blocks as they are written, before they are compressed
+            checksum, hasher = _hasher(checksum)
+            data = _hashing_blocks(_iter_parts(data, self._save_args["block_size"]), hasher)
+
         save_path = get_filepath_str(self._get_save_path(), self._protocol)
 
-        with self._fs.open(save_path, **self._fs_open_args_save) as fs_file:
-            fs_file.write(data)
+        if self._save_args["compression"]:
+            data = _compress_blocks(
+                _iter_parts(data, self._save_args["block_size"]),
+                self._save_args["compression"],
+                self._save_args["compression_level"],
+                self._save_args["compression_threads"],
+            )
+
+        if self._save_args["multipart"]:
+            self._upload_multipart(save_path, data)
+        else:
+            with self._fs.open(save_path, **self._fs_open_args_save) as fs_file:
+                self._write(fs_file, data)
+
+        if hasher is not None:
+            digest = f"{checksum}:{hasher.hexdigest()}"
+        if digest is not None:
+            self._write_digest(save_path, digest)
 
+        self._record_version(save_path)
         self._invalidate_cache()
 
+    def _fetch_latest_load_version(self) -> str:
+        key = self._resolved_versions_key
+        if self._load_args["memoize_version"]:
+            with self._resolved_versions_lock:
+                version = self._resolved_versions.get(key)
+            if version is not None:
+                return version
+
+        version = self._read_latest_pointer() if self._load_args["latest_pointer"] else None
+        if version is None:
+            # lists the versions, and caches the result on the instance
+            version = super()._fetch_latest_load_version()
+
+        if self._load_args["memoize_version"]:
+            with self._resolved_versions_lock:
+                self._resolved_versions[key] = version
+        return version
+
+    def _read_latest_pointer(self) -> str | None:
+        pointer = get_filepath_str(self._filepath / self.LATEST_POINTER, self._protocol)
+        try:
+            version = self._fs.cat_file(pointer).decode("utf-8").strip()
+        except FileNotFoundError:
+            return None
+        versioned_path = get_filepath_str(self._get_versioned_path(version), self._protocol)
+        # the version may have been deleted since the pointer was written
+        return version if version and self._fs.exists(versioned_path) else None
+
+    def _record_version(self, save_path: str) -> None:
+        if self._version is None:
+            return
+        version = PurePosixPath(save_path).parent.name
+        if self._save_args["latest_pointer"]:
+            pointer = get_filepath_str(self._filepath / self.LATEST_POINTER, self._protocol)
+            try:
+                latest = self._fs.cat_file(pointer).decode("utf-8").strip()
+            except FileNotFoundError:
+                latest = ""
+            # versions are timestamps, so a concurrent save of a newer version is kept
+            if version > latest:
+                self._fs.pipe_file(pointer, version.encode("utf-8"))
+        key = self._resolved_versions_key
+        with self._resolved_versions_lock:
+            if key in self._resolved_versions:
+                self._resolved_versions[key] = version
+
+    def _is_unchanged(self, data: bytes, digest: str) -> bool:
+        try:
+            load_path = get_filepath_str(self._get_load_path(), self._protocol)
+            info = self._fs.info(load_path)
+        except (DatasetError, FileNotFoundError):
+            return False
+        compressed = self._save_args["compression"] is not None
+        if not compressed and info.get("size") is not None and info["size"] != len(data):
+            return False
+
+        stored = self._stored_digest(load_path)
+        # unless the file was saved again since, without storing a digest
+        if stored is not None and stored[1] == self._digest_fingerprint(info):
+            return stored[0] == digest
+        md5 = None if compressed else _backend_md5(info)
+        return md5 is not None and md5 == hashlib.md5(data).hexdigest()
+
+    def _write_digest(self, save_path: str, digest: str) -> None:
+        # saves without ``skip_unchanged`` or ``checksum`` leave the digest as it is, so it
+        # is stored with the metadata of the file it was computed for
+        fingerprint = self._digest_fingerprint(self._fs.info(save_path))
+        self._fs.pipe_file(f"{save_path}.digest", f"{digest}\n{fingerprint}".encode())
+
+    def _stored_digest(self, load_path: str) -> tuple[str, str] | None:
+        """Returns the stored digest and the fingerprint of the file it was computed for."""
+        try:
+            stored = self._fs.cat_file(f"{load_path}.digest").decode("utf-8")
+        except FileNotFoundError:
+            return None
+        digest, _, fingerprint = stored.partition("\n")
+        return digest, fingerprint
+
+    @staticmethod
+    def _digest_fingerprint(info: dict[str, Any]) -> str:
+        return json.dumps({**_fingerprint(info), "size": str(info.get("size"))}, sort_keys=True)
+
+    def _upload_multipart(self, save_path: str, data: Any) -> None:
+        upload = _upload_blocks_azure if self._protocol in AZURE_PROTOCOLS else _upload_parts_s3
+        sync(
+            self._fs.loop,
+            upload,
+            self._fs,
+            save_path,
+            _iter_parts(data, self._save_args["part_size"]),
+            self._save_args["max_workers"],
+            self._save_args["resume"],
+        )
+
+    def _write(self, fs_file: Any, data: Any) -> None:
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            fs_file.write(data)
+        elif hasattr(data, "read"):
+            shutil.copyfileobj(data, fs_file, self._save_args["block_size"])
+        else:
+            for block in data:
+                fs_file.write(block)
+
     def _exists(self) -> bool:
         try:
             load_path = get_filepath_str(self._get_load_path(), self._protocol)
@@ -121,9 +1252,153 @@ class BinaryDataset(AbstractVersionedDataset[bytes, bytes]):
 
     def _release(self) -> None:
         super()._release()
+        with self._resolved_versions_lock:
+            self._resolved_versions.pop(self._resolved_versions_key, None)
         self._invalidate_cache()
 
     def _invalidate_cache(self) -> None:
         """Invalidate underlying filesystem caches."""
         filepath = get_filepath_str(self._filepath, self._protocol)
         self._fs.invalidate_cache(filepath)
+
+
+class LazyBinaryMapping(Mapping):
+    """Read-only mapping of relative paths to file contents, returned by
+    ``BinaryBatchDataset`` when loading with ``lazy: True``.
+
+    The files are listed when the mapping is created, but each one is only fetched when it
+    is accessed. Contents are not kept, so accessing a key twice fetches the file twice.
+    """
+
+    def __init__(self, fs: fsspec.AbstractFileSystem, paths: dict[str, str]) -> None:
+        self._fs = fs
+        self._paths = paths
+
+    def __getitem__(self, key: str) -> bytes:
+        return self._fs.cat_file(self._paths[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+
+class BinaryBatchDataset(AbstractDataset[Mapping[str, bytes], Mapping[str, bytes]]):
+    """``BinaryBatchDataset`` loads/saves many small files under a prefix or matching a
+    glob, as a dict of their paths relative to the prefix to their bytes.
+
+    The files are listed with a single request and fetched with bounded concurrency: as
+    batches of concurrent requests on asynchronous filesystems such as S3, GCS or Azure
+    Blob Storage, and by a pool of threads on the others. With ``lazy: True`` in
+    ``load_args``, a load returns a ``LazyBinaryMapping`` that fetches each file on access.
+
+    .. code-block:: yaml
+
+        thumbnails:
+          type: BinaryBatchDataset
+          path: abfs://images/thumbnails/**/*.png
+          load_args:
+            max_workers: 64
+          credentials: my_azure_credentials
+
+    """
+
+    DEFAULT_LOAD_ARGS: dict[str, Any] = {"lazy": False, "max_workers": 32}
+    DEFAULT_SAVE_ARGS: dict[str, Any] = {"max_workers": 32}
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        path: str,
+        credentials: dict[str, Any] = None,
+        fs_args: dict[str, Any] = None,
+        load_args: dict[str, Any] = None,
+        save_args: dict[str, Any] = None,
+        metadata: dict[str, Any] = None,
+    ) -> None:
+        """Creates a new instance of ``BinaryBatchDataset``.
+
+        Args:
+            path: Prefix of the files, or a glob matching them, prefixed with a protocol
+                like `s3://`. Files under a prefix are listed recursively.
+            credentials: Credentials required to get access to the underlying filesystem.
+            fs_args: Extra arguments to pass into underlying filesystem class constructor.
+            load_args: Options for loading: ``lazy`` (return a ``LazyBinaryMapping``
+                instead of a dict, defaults to False) and ``max_workers`` (maximum number
+                of files fetched concurrently, defaults to 32).
+            save_args: Options for saving: ``max_workers`` (maximum number of files
+                written concurrently, defaults to 32).
+            metadata: Any arbitrary metadata.
+                This is ignored by Kedro, but may be consumed by users or external plugins.
+        """
+        _fs_args = deepcopy(fs_args) or {}
+        _credentials = deepcopy(credentials) or {}
+
+        protocol, _path = get_protocol_and_path(path)
+        self._protocol = protocol
+        if protocol == "file":
+            _fs_args.setdefault("auto_mkdir", True)
+        self._fs = get_filesystem(self._protocol, _credentials, _fs_args)
+        # listings return normalised paths, which the relative paths are computed from
+        self._path = self._fs._strip_protocol(_path).rstrip("/")
+        # the relative paths of the files start after the directories without glob patterns
+        parts = PurePosixPath(self._path).parts
+        magic = [i for i, part in enumerate(parts) if any(char in part for char in "*?[")]
+        self._is_glob = bool(magic)
+        self._root = str(PurePosixPath(*parts[: magic[0]])) if magic else self._path
+
+        self._load_args = {**self.DEFAULT_LOAD_ARGS, **(load_args or {})}
+        self._save_args = {**self.DEFAULT_SAVE_ARGS, **(save_args or {})}
+        self.metadata = metadata
+
+    def _describe(self) -> dict[str, Any]:
+        return {
+            "path": self._path,
+            "protocol": self._protocol,
+            "load_args": self._load_args,
+            "save_args": self._save_args,
+        }
+
+    def _list(self) -> dict[str, str]:
+        if self._is_glob:
+            found = self._fs.glob(self._path, detail=True)
+        else:
+            found = self._fs.find(self._path, detail=True)
+        paths = sorted(name for name, info in found.items() if info["type"] == "file")
+        return {PurePosixPath(path).relative_to(self._root).as_posix(): path for path in paths}
+
+    def _load(self) -> Mapping[str, bytes]:
+        paths = self._list()
+        if self._load_args["lazy"]:
+            return LazyBinaryMapping(self._fs, paths)
+
+        max_workers = self._load_args["max_workers"]
+        if not paths:
+            return {}
+        if self._fs.async_impl:
+            contents = self._fs.cat(list(paths.values()), batch_size=max_workers)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                fetched = executor.map(self._fs.cat_file, paths.values())
+                contents = dict(zip(paths.values(), fetched, strict=True))
+        return {key: contents[path] for key, path in paths.items()}
+
+    def _save(self, data: Mapping[str, bytes]) -> None:
+        if self._is_glob:
+            raise DatasetError(
+                f"Cannot save to '{self._path}': saving requires a prefix, not a glob."
+            )
+
+        files = {f"{self._path}/{key}": bytes(content) for key, content in data.items()}
+        max_workers = self._save_args["max_workers"]
+        if self._fs.async_impl:
+            self._fs.pipe(files, batch_size=max_workers)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(self._fs.pipe_file, files.keys(), files.values()))
+
+        self._fs.invalidate_cache(self._path)
+
+    def _exists(self) -> bool:
+        return bool(self._list())
@@ -0,0 +1,64 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Any
+
+import fsspec
+
+_filesystems: dict[tuple[int, int | None, str, str], fsspec.AbstractFileSystem] = {}
+_lock = threading.Lock()
+
+
+def _options_hash(credentials: dict[str, Any], fs_args: dict[str, Any]) -> str:
+    # objects that are not JSON serialisable, such as credential objects, are hashed by
+    # their repr, which usually includes their id, so they are never shared by mistake
+    encoded = json.dumps(
+        {"credentials": credentials, "fs_args": fs_args}, sort_keys=True, default=repr
+    ).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def get_filesystem(
+    protocol: str,
+    credentials: dict[str, Any] = None,
+    fs_args: dict[str, Any] = None,
+) -> fsspec.AbstractFileSystem:
+    """Returns a filesystem shared by all the datasets with the same protocol and options.
+
+    Unlike the instance cache of ``fsspec``, which is per thread, asynchronous filesystems
+    such as S3, GCS or Azure Blob Storage, which run on their own event loop, are shared by
+    all the threads of the process, so a catalog with many entries on the same storage
+    account creates and authenticates a single client. The clients of the other
+    filesystems, e.g. SFTP, FTP or SMB, are not thread-safe, so they are only shared within
+    a thread. A forked process creates its own filesystems.
+
+    Options are compared by value, except for objects that are not JSON serialisable, such
+    as credential objects, which are compared by their ``repr``. That usually includes their
+    id, and the datasets copy their credentials, so filesystems created with credential
+    objects are never shared.
+
+    Args:
+        protocol: The protocol of the filesystem, e.g. ``abfs``.
+        credentials: Credentials required to get access to the filesystem.
+        fs_args: Extra arguments to pass into the filesystem class constructor.
+
+    Returns:
+        The filesystem.
+    """
+    credentials = credentials or {}
+    fs_args = fs_args or {}
+    # ``None`` shares the filesystem with all the threads
+    thread = None if fsspec.get_filesystem_class(protocol).async_impl else threading.get_ident()
+    key = (os.getpid(), thread, protocol, _options_hash(credentials, fs_args))
+    with _lock:
+        fs = _filesystems.get(key)
+        if fs is None:
+            fs = _filesystems[key] = fsspec.filesystem(protocol, **credentials, **fs_args)
+    return fs
+
+
+def clear_filesystems() -> None:
+    """Forgets the shared filesystems, e.g. after their credentials were rotated."""
+    with _lock:
+        _filesystems.clear()
@@ -2,7 +2,6 @@ from copy import deepcopy
 from pathlib import PurePosixPath
 from typing import Any, Dict
 
-import fsspec
 import pandas as pd
 import tabula
 from kedro.io.core import (
@@ -12,6 +11,8 @@ from kedro.io.core import (
     get_protocol_and_path,
 )
 
+from fusion_datasets.filesystem import get_filesystem
+
 
 class PDFDataset(AbstractVersionedDataset):
     def __init__(
@@ -38,7 +39,7 @@ class PDFDataset(AbstractVersionedDataset):
             _fs_args.setdefault("auto_mkdir", True)
         self._protocol = protocol
         self._storage_options = {**_credentials, **_fs_args}
-        self._fs = fsspec.filesystem(self._protocol, **self._storage_options)
+        self._fs = get_filesystem(self._protocol, _credentials, _fs_args)
         super().__init__(
             filepath=PurePosixPath(path),
             version=version,
@@ -0,0 +1,109 @@
+import importlib.util
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+
+def check_installed(module: str, option: str) -> None:
+    """Raises an ``ImportError`` if the optional package that ``option`` needs is missing.
+
+    Args:
+        module: The module of the optional package, e.g. ``zstandard``.
+        option: The dataset option that requires it, e.g. ``compression``.
+
+    Raises:
+        ImportError: If ``module`` cannot be imported.
+    """
+    if importlib.util.find_spec(module) is None:
+        raise ImportError(f"{option!r} requires the {module!r} package.")
+
+
+class DirectoryCache:
+    """Local directory of cache entries, evicted by least recent use.
+
+    Every entry is a file named after its key. Reading an entry refreshes its modification
+    time, which is used to evict the least recently used entries once the cache grows over
+    ``max_bytes``. Entries are written to a temporary file and renamed, so several
+    processes can share the directory.
+
+    The directory is listed once, on the first write, then the entries and their sizes are
+    tracked in memory, so entries that other processes write later are only evicted by
+    them.
+    """
+
+    def __init__(self, path: str, max_bytes: int, suffix: str = ".bin") -> None:
+        """Creates a new instance of ``DirectoryCache``.
+
+        Args:
+            path: The directory of the cache, created on the first write.
+            max_bytes: The size of the entries above which the least recently used are
+                evicted.
+            suffix: The extension of the entry files.
+        """
+        self._path = Path(path)
+        self._max_bytes = max_bytes
+        self._suffix = suffix
+        # entry file names and sizes, least recently used first; None until listed
+        self._entries: OrderedDict[str, int] | None = None
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_entries"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        """Returns the content of an entry, or None if there is no entry for ``key``."""
+        path = self._path / f"{key}{self._suffix}"
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        with self._lock:
+            if self._entries is not None and path.name in self._entries:
+                self._entries.move_to_end(path.name)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Writes an entry, then evicts the least recently used entries over the limit."""
+        self._path.mkdir(parents=True, exist_ok=True)
+        name = f"{key}{self._suffix}"
+        fd, tmp_path = tempfile.mkstemp(dir=self._path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as entry_file:
+                entry_file.write(data)
+            os.replace(tmp_path, self._path / name)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._list_entries()
+                self._size = sum(self._entries.values())
+            else:
+                self._size += len(data) - self._entries.pop(name, 0)
+                self._entries[name] = len(data)
+            while self._size > self._max_bytes and self._entries:
+                evicted, size = self._entries.popitem(last=False)
+                (self._path / evicted).unlink(missing_ok=True)
+                self._size -= size
+
+    def _list_entries(self) -> OrderedDict[str, int]:
+        entries = []
+        for path in self._path.glob(f"*{self._suffix}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path.name, stat.st_size))
+        return OrderedDict((name, size) for _, name, size in sorted(entries))
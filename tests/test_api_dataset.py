@@ -0,0 +1,570 @@
+import gzip
+import json
+import time
+import uuid
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+import requests
+from kedro.io.core import DatasetError
+
+from fusion_datasets.api_dataset import (
+    APIDataset,
+    SaveStats,
+    _RateLimiter,
+    _ResponseCache,
+)
+
+URL = "https://example.com/api/events"
+
+
+@pytest.fixture
+def records():
+    return [{"id": i} for i in range(10)]
+
+
+def sent_json(call):
+    return json.loads(call.kwargs["data"])
+
+
+def make_response(status_code=200, headers=None):
+    response = MagicMock(spec=requests.Response)
+    response.status_code = status_code
+    response.headers = headers or {}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            f"{status_code} Error", response=response
+        )
+    return response
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_save_returns_all_chunk_responses(records, max_workers):
+    dataset = APIDataset(
+        url=URL,
+        method="POST",
+        save_args={"chunk_size": 3, "max_workers": max_workers},
+    )
+    with patch("requests.Session.request", return_value=make_response()) as mock_request:
+        responses = dataset._execute_save_with_chunks(records)
+
+    assert len(responses) == 4
+    sent = sorted(sent_json(call)[0]["id"] for call in mock_request.call_args_list)
+    assert sent == [0, 3, 6, 9]
+
+
+def test_save_unwraps_records(records):
+    dataset = APIDataset(url=URL, method="POST", save_args={"chunk_size": -1})
+    with patch("requests.Session.request", return_value=make_response()) as mock_request:
+        dataset._execute_save_with_chunks(records)
+
+    assert [sent_json(call) for call in mock_request.call_args_list] == records
+
+
+def test_concurrent_save_reports_failed_chunks_in_order(records):
+    dataset = APIDataset(
+        url=URL,
+        method="POST",
+        save_args={"chunk_size": 2, "max_workers": 4},
+    )
+
+    def fake_request(**kwargs):
+        first_id = json.loads(kwargs["data"])[0]["id"]
+        return make_response(500 if first_id in (6, 2) else 200)
+
+    with patch("requests.Session.request", side_effect=fake_request):
+        with pytest.raises(DatasetError, match=r"chunk indices: \[1, 3\]"):
+            dataset._execute_save_with_chunks(records)
+
+
+def test_concurrent_save_reports_chunks_that_fail_to_encode(records):
+    records[4] = {"id": float("nan")}
+    dataset = APIDataset(
+        url=URL,
+        method="POST",
+        save_args={"chunk_size": 3, "max_workers": 4},
+    )
+
+    with patch("requests.Session.request", return_value=make_response()) as mock_request:
+        with pytest.raises(DatasetError, match=r"chunk indices: \[1\]") as exc_info:
+            dataset._execute_save_with_chunks(records)
+
+    assert isinstance(exc_info.value.__cause__, ValueError)
+    assert mock_request.call_count == 3
+
+
+def test_string_payload_is_sent_as_json():
+    dataset = APIDataset(url=URL, method="POST")
+    with patch("requests.Session.request", return_value=make_response()) as mock_request:
+        dataset.save('{"id": 1}')
+
+    assert sent_json(mock_request.call_args) == {"id": 1}
+
+
+def test_invalid_max_workers():
+    with pytest.raises(ValueError, match="max_workers"):
+        APIDataset(url=URL, method="POST", save_args={"max_workers": 0})
+
+
+def test_session_is_reused_across_chunks_and_saves(records):
+    dataset = APIDataset(
+        url=URL,
+        method="POST",
+        save_args={"chunk_size": 2, "max_workers": 4},
+        session_args={"pool_maxsize": 2},
+    )
+    with patch("requests.Session.request", return_value=make_response()):
+        dataset._execute_save_with_chunks(records)
+        session = dataset._session
+        dataset._execute_save_with_chunks(records)
+
+    assert dataset._session is session
+    assert session.get_adapter(URL)._pool_maxsize == 4
+
+
+def test_pool_size_covers_pagination_workers():
+    dataset = APIDataset(url=URL, load_args={"pagination": {"max_workers": 32}})
+
+    assert dataset._get_session().get_adapter(URL)._pool_maxsize == 32
+
+
+def test_release_closes_session(records):
+    dataset = APIDataset(url=URL, method="POST", session_args={"keep_alive": False})
+    session = dataset._get_session()
+    assert session.headers["Connection"] == "close"
+
+    dataset.release()
+    assert dataset._session is None
+
+
+def test_byte_budget_groups_records_by_size():
+    records = [{"payload": "x" * size} for size in (10, 10, 60, 10, 10, 10)]
+    dataset = APIDataset(url=URL, method="POST", save_args={"max_chunk_bytes": 90})
+    with patch("requests.Session.request", return_value=make_response()) as mock_request:
+        dataset._execute_save_with_chunks(records)
+
+    sizes = [len(sent_json(call)) for call in mock_request.call_args_list]
+    assert sizes == [2, 1, 3]
+
+
+def test_byte_budget_encodes_each_record_once(records):
+    dataset = APIDataset(url=URL, method="POST", save_args={"max_chunk_bytes": 50})
+    with patch("requests.Session.request", return_value=make_response()) as mock_request:
+        with patch("json.dumps", wraps=json.dumps) as dumps:
+            dataset._execute_save_with_chunks(records)
+
+    assert dumps.call_count == len(records)
+    assert len(mock_request.call_args_list) > 1
+    assert [record for call in mock_request.call_args_list for record in sent_json(call)] == records
+
+
+def test_adaptive_chunking_splits_rejected_chunks():
+    records = [{"id": i} for i in range(8)]
+    dataset = APIDataset(
+        url=URL,
+        method="POST",
+        save_args={"max_chunk_bytes": 1000, "adaptive_chunking": True},
+    )
+
+    def fake_request(**kwargs):
+        return make_response(413 if len(json.loads(kwargs["data"])) > 2 else 200)
+
+    with patch("requests.Session.request", side_effect=fake_request) as mock_request:
+        responses = dataset._execute_save_with_chunks(records)
+
+    assert len(responses) == 4
+    accepted = [
+        sent_json(call) for call in mock_request.call_args_list if len(sent_json(call)) <= 2
+    ]
+    assert [record for chunk in accepted for record in chunk] == records
+
+
+def test_adaptive_chunking_requires_byte_budget():
+    with pytest.raises(ValueError, match="max_chunk_bytes"):
+        APIDataset(url=URL, method="POST", save_args={"adaptive_chunking": True})
+
+
+def test_transient_failures_are_retried(records):
+    dataset = APIDataset(
+        url=URL,
+        method="POST",
+        save_args={"chunk_size": 5, "retry": {"max_retries": 2, "backoff_factor": 0}},
+    )
+    responses = [make_response(503), make_response(), make_response()]
+    with (
+        patch("requests.Session.request", side_effect=responses) as mock_request,
+        patch("time.sleep"),
+    ):
+        dataset._execute_save_with_chunks(records)
+
+    assert mock_request.call_count == 3
+
+
+def test_client_errors_are_not_retried(records):
+    dataset = APIDataset(
+        url=URL,
+        method="POST",
+        save_args={"chunk_size": 5, "retry": {"max_retries": 2}},
+    )
+    with patch("requests.Session.request", return_value=make_response(400)) as mock_request:
+        with pytest.raises(DatasetError):
+            dataset._execute_save_with_chunks(records)
+
+    assert mock_request.call_count == 1
+
+
+def test_progress_journal_skips_sent_chunks(records, tmp_path):
+    journal = tmp_path / "upload.journal"
+    dataset = APIDataset(
+        url=URL,
+        method="POST",
+        save_args={"chunk_size": 2, "progress_journal": str(journal)},
+    )
+
+    def failing_request(**kwargs):
+        return make_response(500 if json.loads(kwargs["data"])[0]["id"] == 6 else 200)
+
+    with patch("requests.Session.request", side_effect=failing_request):
+        with pytest.raises(DatasetError, match=r"chunk indices: \[3\]"):
+            dataset._execute_save_with_chunks(records)
+    assert len(journal.read_text().splitlines()) == 3
+
+    with patch("requests.Session.request", return_value=make_response()) as mock_request:
+        dataset._execute_save_with_chunks(records)
+
+    assert [sent_json(call)[0]["id"] for call in mock_request.call_args_list] == [6, 8]
+    assert not journal.exists()
+
+
+def test_progress_journal_uses_the_serializer(tmp_path):
+    dataset = APIDataset(
+        url=URL,
+        method="POST",
+        save_args={
+            "chunk_size": 1,
+            "serializer": "orjson",
+            "progress_journal": str(tmp_path / "upload.journal"),
+        },
+    )
+    with patch("requests.Session.request", return_value=make_response()) as mock_request:
+        dataset._execute_save_with_chunks([{"id": uuid.UUID(int=0)}])
+
+    assert sent_json(mock_request.call_args)[0]["id"] == str(uuid.UUID(int=0))
+
+
+def test_gzip_compressed_bodies(records):
+    dataset = APIDataset(
+        url=URL,
+        method="POST",
+        save_args={"chunk_size": 5, "compression": "gzip", "headers": {"X-Key": "k"}},
+    )
+    with patch("requests.Session.request", return_value=make_response()) as mock_request:
+        dataset._execute_save_with_chunks(records)
+
+    call = mock_request.call_args_list[0]
+    assert json.loads(gzip.decompress(call.kwargs["data"])) == records[:5]
+    assert call.kwargs["headers"] == {
+        "X-Key": "k",
+        "Content-Type": "application/json",
+        "Content-Encoding": "gzip",
+    }
+
+
+def test_invalid_compression():
+    with pytest.raises(ValueError, match="compression"):
+        APIDataset(url=URL, method="POST", save_args={"compression": "brotli"})
+
+
+@pytest.mark.parametrize("serializer", ["json", "orjson"])
+def test_serializers_encode_numpy_and_pandas_scalars(serializer):
+    pytest.importorskip(serializer)
+    dataset = APIDataset(url=URL, method="POST", save_args={"serializer": serializer})
+    record = {
+        "count": np.int64(3),
+        "ratio": np.float32(0.5),
+        "flag": np.bool_(True),
+        "at": pd.Timestamp("2024-01-02"),
+        "missing": pd.NaT,
+    }
+
+    decoded = json.loads(dataset._encode_body([record]))
+
+    assert decoded[0]["count"] == 3
+    assert decoded[0]["ratio"] == 0.5
+    assert decoded[0]["flag"] is True
+    assert decoded[0]["at"].startswith("2024-01-02")
+    assert decoded[0]["missing"] is None
+
+
+def test_msgpack_serializer_sets_content_type():
+    pytest.importorskip("msgpack")
+    dataset = APIDataset(url=URL, method="POST", save_args={"serializer": "msgpack"})
+
+    assert dataset._save_headers["Content-Type"] == "application/msgpack"
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_ndjson_streams_records_from_a_generator(compression):
+    dataset = APIDataset(
+        url=URL,
+        method="POST",
+        save_args={"ndjson": True, "compression": compression},
+    )
+    dataset.STREAM_BUFFER_BYTES = 64
+    bodies = []
+
+    def fake_request(**kwargs):
+        bodies.append(b"".join(kwargs["data"]))
+        return make_response()
+
+    with patch("requests.Session.request", side_effect=fake_request) as mock_request:
+        dataset.save({"id": i} for i in range(100))
+
+    body = gzip.decompress(bodies[0]) if compression else bodies[0]
+    assert [json.loads(line) for line in body.splitlines()] == [{"id": i} for i in range(100)]
+    assert mock_request.call_count == 1
+    assert mock_request.call_args.kwargs["headers"]["Content-Type"] == "application/x-ndjson"
+
+
+def test_rate_limiter_paces_requests_and_bytes():
+    limiter = _RateLimiter(requests_per_second=10, bytes_per_minute=600)
+
+    assert limiter.reserve(n_bytes=5) == 0
+    assert limiter.reserve(n_bytes=10) == pytest.approx(0.5, abs=0.05)
+    assert limiter.reserve(requests=0, n_bytes=10) == pytest.approx(1.5, abs=0.05)
+
+
+def test_rate_limiter_follows_response_headers():
+    limiter = _RateLimiter(requests_per_second=100)
+
+    limiter.update(200, {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "10"})
+    limiter.reserve()
+    assert limiter.reserve() == pytest.approx(1.0, abs=0.05)
+
+    limiter.update(429, {"Retry-After": "30"})
+    assert limiter.reserve(requests=0) == pytest.approx(30, abs=0.1)
+
+
+def test_rate_limit_applies_to_saves(records):
+    dataset = APIDataset(
+        url=URL,
+        method="POST",
+        save_args={"chunk_size": 5},
+        rate_limit={"requests_per_second": 1},
+    )
+    with (
+        patch("requests.Session.request", return_value=make_response()),
+        patch("time.sleep") as mock_sleep,
+    ):
+        dataset._execute_save_with_chunks(records)
+
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+    assert delays[0] == 0
+    assert delays[1] == pytest.approx(1.0, abs=0.05)
+
+
+def paged_api(total, page_size, with_total=True):
+    rows = [{"id": i} for i in range(total)]
+
+    def fake_request(**kwargs):
+        params = kwargs["params"]
+        offset = params["offset"]
+        payload = {"data": rows[offset : offset + params["limit"]]}
+        if with_total:
+            payload["meta"] = {"total": total}
+        response = make_response()
+        response.json.return_value = payload
+        return response
+
+    return fake_request
+
+
+@pytest.mark.parametrize("with_total", [True, False])
+def test_offset_pagination_loads_all_pages(with_total):
+    dataset = APIDataset(
+        url=URL,
+        load_args={
+            "params": {"active": 1},
+            "pagination": {
+                "page_size": 10,
+                "records_key": "data",
+                "total_key": "meta.total",
+                "max_workers": 4,
+            },
+        },
+    )
+    with patch(
+        "requests.Session.request", side_effect=paged_api(35, 10, with_total)
+    ) as mock_request:
+        data = dataset.load()
+
+    assert data["id"].tolist() == list(range(35))
+    assert mock_request.call_count == 4
+    assert all(call.kwargs["params"]["active"] == 1 for call in mock_request.call_args_list)
+
+
+def test_cursor_pagination_yields_pages():
+    pages = {
+        None: {"items": [{"id": 0}, {"id": 1}], "next": "b"},
+        "b": {"items": [{"id": 2}], "next": None},
+    }
+
+    def fake_request(**kwargs):
+        response = make_response()
+        response.json.return_value = pages[kwargs["params"].get("after")]
+        return response
+
+    dataset = APIDataset(
+        url=URL,
+        load_args={
+            "pagination": {
+                "type": "cursor",
+                "cursor_param": "after",
+                "cursor_key": "next",
+                "records_key": "items",
+                "output": "iterator",
+            },
+        },
+    )
+    with patch("requests.Session.request", side_effect=fake_request):
+        frames = list(dataset.load())
+
+    assert [frame["id"].tolist() for frame in frames] == [[0, 1], [2]]
+
+
+def test_cached_loads_are_revalidated(tmp_path):
+    dataset = APIDataset(url=URL, load_args={"cache": {"path": str(tmp_path)}})
+    fresh = requests.Response()
+    fresh.status_code = 200
+    fresh.headers["ETag"] = '"v1"'
+    fresh._content = b'{"rates": [1, 2]}'
+    not_modified = make_response(304)
+
+    with patch("requests.Session.request", side_effect=[fresh, not_modified]) as mock_request:
+        first = dataset.load()
+        second = dataset.load()
+
+    assert first.json() == second.json() == {"rates": [1, 2]}
+    assert "If-None-Match" not in (mock_request.call_args_list[0].kwargs.get("headers") or {})
+    assert mock_request.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+
+
+def test_cached_pages_within_ttl_are_not_requested(tmp_path):
+    dataset = APIDataset(
+        url=URL,
+        load_args={
+            "pagination": {"page_size": 10, "records_key": "data"},
+            "cache": {"path": str(tmp_path), "ttl": 60},
+        },
+    )
+    with patch("requests.Session.request", side_effect=paged_api(5, 10)) as mock_request:
+        first = dataset.load()
+        second = dataset.load()
+
+    assert mock_request.call_count == 1
+    assert second.equals(first)
+
+
+def test_response_cache_evicts_least_recently_used(tmp_path):
+    cache = _ResponseCache(str(tmp_path), max_bytes=2500)
+    for key in ("a", "b", "c"):
+        cache.put(key, {"payload": b"x" * 1000})
+        time.sleep(0.01)
+
+    assert cache.get("a") is None
+    assert cache.get("c") is not None
+
+
+def test_save_collects_stats(records):
+    dataset = APIDataset(
+        url=URL,
+        method="POST",
+        save_args={"chunk_size": 5, "retry": {"max_retries": 1, "backoff_factor": 0}},
+    )
+    responses = [make_response(503), make_response(), make_response()]
+    with (
+        patch("requests.Session.request", side_effect=responses),
+        patch("time.sleep"),
+    ):
+        dataset.save(records)
+
+    stats = dataset.last_save_stats.to_dict()
+    assert stats["requests"] == 3
+    assert stats["retries"] == 1
+    assert stats["status_codes"] == {"503": 1, "200": 2}
+    assert stats["bytes_sent"] == 3 * len(json.dumps(records[:5]))
+    assert stats["latency_p50"] is not None
+    assert stats["duration"] > 0
+
+
+def test_latency_percentiles_use_nearest_rank():
+    stats = SaveStats()
+    for latency in range(1, 11):
+        stats.record_request(200, latency, 0)
+
+    assert stats.latency_percentile(0) == 1
+    assert stats.latency_percentile(50) == 5
+    assert stats.latency_percentile(90) == 9
+    assert stats.latency_percentile(99) == 10
+
+
+def test_asyncio_engine_keeps_chunk_order(records):
+    dataset = APIDataset(
+        url=URL,
+        method="POST",
+        save_args={"chunk_size": -1, "engine": "asyncio", "max_workers": 3},
+    )
+
+    async def fake_send(session, request_args, body):
+        return json.loads(body)["id"]
+
+    with patch.object(dataset, "_execute_save_request_async", side_effect=fake_send):
+        responses = dataset._execute_save_with_chunks(records)
+
+    assert responses == list(range(10))
+
+
+def test_asyncio_engine_reports_failed_chunks(records):
+    dataset = APIDataset(
+        url=URL,
+        method="POST",
+        save_args={"chunk_size": 5, "engine": "asyncio"},
+    )
+
+    async def fake_send(session, request_args, body):
+        if json.loads(body)[0]["id"] == 5:
+            raise DatasetError("Failed to send data")
+        return body
+
+    with patch.object(dataset, "_execute_save_request_async", side_effect=fake_send):
+        with pytest.raises(DatasetError, match=r"chunk indices: \[1\]"):
+            dataset._execute_save_with_chunks(records)
+
+
+def test_asyncio_engine_records_sent_chunks_in_the_journal(records, tmp_path):
+    journal = tmp_path / "upload.journal"
+    dataset = APIDataset(
+        url=URL,
+        method="POST",
+        save_args={"chunk_size": 3, "engine": "asyncio", "progress_journal": str(journal)},
+    )
+    records[4]["value"] = float("nan")
+
+    async def fake_send(session, request_args, body):
+        return body
+
+    with patch.object(dataset, "_execute_save_request_async", side_effect=fake_send):
+        with pytest.raises(DatasetError, match=r"chunk indices: \[1\]") as exc_info:
+            dataset._execute_save_with_chunks(records)
+
+    sent = sorted(line.split("\t")[0] for line in journal.read_text().splitlines())
+    assert isinstance(exc_info.value.__cause__, ValueError)
+    assert sent == ["0", "2", "3"]
+
+
+def test_asyncio_engine_requires_aiohttp():
+    with patch("importlib.util.find_spec", return_value=None):
+        with pytest.raises(ImportError, match="'engine' requires the 'aiohttp' package"):
+            APIDataset(url=URL, method="POST", save_args={"engine": "asyncio"})
@@ -0,0 +1,653 @@
+import asyncio
+import gzip
+import hashlib
+import io
+import random
+import warnings
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import fsspec.asyn
+import pytest
+from kedro.io.core import DatasetError, Version
+
+from fusion_datasets.binary_dataset import (
+    BinaryBatchDataset,
+    BinaryBlockReader,
+    BinaryDataset,
+    LazyBinaryMapping,
+    _iter_parts,
+    _upload_blocks_azure,
+    _upload_parts_s3,
+)
+
+
+@pytest.fixture
+def payload():
+    return bytes(range(256)) * 40
+
+
+@pytest.fixture
+def filepath(tmp_path):
+    return (tmp_path / "data.bin").as_posix()
+
+
+def test_save_and_load(filepath, payload):
+    dataset = BinaryDataset(filepath=filepath)
+    dataset.save(payload)
+
+    assert dataset.load() == payload
+
+
+def test_streaming_load_yields_blocks(filepath, payload):
+    BinaryDataset(filepath=filepath).save(payload)
+    dataset = BinaryDataset(filepath=filepath, load_args={"stream": True, "block_size": 4096})
+
+    reader = dataset.load()
+
+    assert isinstance(reader, BinaryBlockReader)
+    blocks = list(reader)
+    assert [len(block) for block in blocks] == [4096, 4096, 2048]
+    assert b"".join(blocks) == payload
+
+
+@pytest.mark.parametrize("as_file", [False, True])
+def test_save_copies_blocks(tmp_path, filepath, payload, as_file):
+    BinaryDataset(filepath=filepath).save(payload)
+    reader = BinaryDataset(filepath=filepath, load_args={"stream": True}).load()
+    data = io.BytesIO(payload) if as_file else reader
+    target = BinaryDataset(filepath=(tmp_path / "copy.bin").as_posix())
+
+    target.save(data)
+
+    assert target.load() == payload
+
+
+def test_mmap_load_returns_read_only_view(filepath, payload):
+    BinaryDataset(filepath=filepath).save(payload)
+    dataset = BinaryDataset(filepath=filepath, load_args={"mmap": True})
+
+    view = dataset.load()
+
+    assert isinstance(view, memoryview)
+    assert view.readonly
+    assert view.tobytes() == payload
+
+
+def test_mmap_load_of_empty_file(filepath):
+    BinaryDataset(filepath=filepath).save(b"")
+
+    assert BinaryDataset(filepath=filepath, load_args={"mmap": True}).load() == b""
+
+
+def test_parallel_load_assembles_ranges(filepath, payload):
+    BinaryDataset(filepath=filepath).save(payload)
+    dataset = BinaryDataset(
+        filepath=filepath,
+        load_args={"parallel": True, "range_size": 1000, "max_workers": 4},
+    )
+
+    loaded = dataset.load()
+
+    assert isinstance(loaded, bytearray)
+    assert loaded == payload
+
+
+@pytest.mark.parametrize(
+    ("offset", "length", "expected"),
+    [(100, 10, slice(100, 110)), (-8, None, slice(-8, None)), (None, 16, slice(0, 16))],
+)
+@pytest.mark.parametrize("mmap", [False, True])
+def test_range_load(filepath, payload, offset, length, expected, mmap):
+    BinaryDataset(filepath=filepath).save(payload)
+    dataset = BinaryDataset(
+        filepath=filepath, load_args={"offset": offset, "length": length, "mmap": mmap}
+    )
+
+    assert dataset.load() == payload[expected]
+
+
+def test_read_range(filepath, payload):
+    dataset = BinaryDataset(filepath=filepath)
+    dataset.save(payload)
+
+    assert dataset.read_range(1024, 4) == payload[1024:1028]
+    assert dataset.read_range(-4, 4) == payload[-4:]
+
+
+def test_cache_serves_unchanged_remote_files(tmp_path, payload):
+    cache = tmp_path / "cache"
+    dataset = BinaryDataset(
+        filepath="memory://bucket/cached.bin", load_args={"cache": {"path": str(cache)}}
+    )
+    dataset.save(payload)
+
+    assert dataset.load() == payload
+    assert len(list(cache.glob("*.bin"))) == 1
+    with patch.object(dataset._fs, "open", side_effect=AssertionError("downloaded")):
+        assert dataset.load() == payload
+
+    dataset.save(payload[:100])
+
+    assert dataset.load() == payload[:100]
+    assert len(list(cache.glob("*.bin"))) == 2
+
+
+def test_cache_evicts_least_recently_used(tmp_path, payload):
+    cache = tmp_path / "cache"
+    for name in ("a", "b"):
+        dataset = BinaryDataset(
+            filepath=f"memory://bucket/{name}.bin",
+            load_args={"cache": {"path": str(cache), "max_bytes": len(payload)}},
+        )
+        dataset.save(payload)
+        dataset.load()
+
+    assert len(list(cache.glob("*.bin"))) == 1
+
+
+def test_cache_is_ignored_for_streamed_loads(tmp_path, caplog):
+    dataset = BinaryDataset(
+        filepath="memory://bucket/streamed.bin",
+        load_args={"stream": True, "cache": {"path": str(tmp_path / "cache")}},
+    )
+
+    assert dataset._local_cache is None
+    assert "'cache' does not apply to streamed loads" in caplog.text
+
+
+def test_cache_entries_depend_on_compression(tmp_path, payload):
+    filepath = "memory://bucket/cached.bin.gz"
+    BinaryDataset(filepath=filepath, save_args={"compression": "gzip"}).save(payload)
+    cache = {"path": str(tmp_path / "cache")}
+
+    raw = BinaryDataset(filepath=filepath, load_args={"cache": cache}).load()
+    decompressed = BinaryDataset(
+        filepath=filepath, load_args={"cache": cache, "compression": "gzip"}
+    ).load()
+
+    assert gzip.decompress(raw) == payload
+    assert decompressed == payload
+
+
+def test_skip_unchanged_save(filepath, payload):
+    dataset = BinaryDataset(filepath=filepath, save_args={"skip_unchanged": True})
+    dataset.save(payload)
+
+    with patch.object(dataset, "_write", side_effect=AssertionError("written")):
+        dataset.save(payload)
+    dataset.save(payload[::-1])
+
+    assert dataset.load() == payload[::-1]
+
+
+def test_skip_unchanged_save_with_versioning(tmp_path, payload):
+    filepath = (tmp_path / "versioned.bin").as_posix()
+    BinaryDataset(
+        filepath=filepath, version=Version(None, None), save_args={"skip_unchanged": True}
+    ).save(payload)
+    dataset = BinaryDataset(
+        filepath=filepath, version=Version(None, None), save_args={"skip_unchanged": True}
+    )
+
+    filters = list(warnings.filters)
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        dataset.save(payload)
+
+    assert len(list((tmp_path / "versioned.bin").iterdir())) == 1
+    assert not [w for w in caught if "did not match load version" in str(w.message)]
+    assert warnings.filters == filters
+
+
+def test_skip_unchanged_save_ignores_digest_of_other_saves(filepath, payload):
+    BinaryDataset(filepath=filepath, save_args={"skip_unchanged": True}).save(payload)
+    plain = BinaryDataset(filepath=filepath)
+    with patch.object(plain._fs, "rm_file", side_effect=PermissionError("write-only")):
+        plain.save(payload[::-1])
+    BinaryDataset(filepath=filepath, save_args={"skip_unchanged": True}).save(payload)
+
+    assert BinaryDataset(filepath=filepath).load() == payload
+
+
+@pytest.mark.parametrize(
+    "load_args", [{}, {"stream": True}, {"parallel": True, "range_size": 1000}]
+)
+def test_gzip_compression(tmp_path, payload, load_args):
+    filepath = (tmp_path / "data.bin.gz").as_posix()
+    BinaryDataset(filepath=filepath, save_args={"compression": "infer", "block_size": 1000}).save(
+        payload
+    )
+    dataset = BinaryDataset(filepath=filepath, load_args={"compression": "infer", **load_args})
+
+    with open(filepath, "rb") as stored:
+        assert gzip.decompress(stored.read()) == payload
+    loaded = dataset.load()
+    assert (loaded.read_all() if load_args.get("stream") else loaded) == payload
+
+
+def test_gzip_compression_level_defaults_to_6(filepath):
+    # random words, which compress differently at each level
+    words = [b"alpha", b"beta", b"gamma", b"delta", b"epsilon", b"zeta", b"eta", b"theta"]
+    rng = random.Random(0)
+    payload = b" ".join(rng.choice(words) for _ in range(50000))
+    BinaryDataset(filepath=filepath, save_args={"compression": "gzip"}).save(payload)
+
+    # the header, with the modification time and file name, is followed by the deflate stream
+    expected = gzip.compress(payload, compresslevel=6)[10:]
+    with open(filepath, "rb") as stored:
+        assert stored.read().endswith(expected)
+
+
+def test_compression_is_detected_from_header(filepath, payload):
+    BinaryDataset(filepath=filepath, save_args={"compression": "gzip"}).save(payload)
+
+    assert BinaryDataset(filepath=filepath, load_args={"compression": "infer"}).load() == payload
+    assert BinaryDataset(filepath=filepath).load() != payload
+
+
+@pytest.mark.parametrize("extension", ["zip", "bz2", "xz"])
+def test_inferred_unsupported_compression_saves_uncompressed(tmp_path, payload, extension):
+    filepath = (tmp_path / f"data.bin.{extension}").as_posix()
+    BinaryDataset(filepath=filepath, save_args={"compression": "infer"}).save(payload)
+
+    with open(filepath, "rb") as stored:
+        assert stored.read() == payload
+
+
+def test_unsupported_compression(filepath):
+    with pytest.raises(ValueError, match="Unsupported compression 'brotli'"):
+        BinaryDataset(filepath=filepath, save_args={"compression": "brotli"})
+
+
+@pytest.mark.parametrize("save_args", [{}, {"compression": "gzip"}])
+def test_async_save_and_load(filepath, payload, save_args):
+    dataset = BinaryDataset(
+        filepath=filepath, save_args=save_args, load_args={"compression": "infer"}
+    )
+
+    async def _round_trip():
+        await dataset.asave(payload)
+        return await asyncio.gather(dataset.aload(), dataset.aload())
+
+    assert asyncio.run(_round_trip()) == [payload, payload]
+
+
+def test_async_save_and_load_run_on_the_filesystem_loop(filepath, payload):
+    fs_loop = fsspec.asyn.get_loop()
+    loops = []
+
+    async def _on_loop(*args, **kwargs):
+        loops.append(asyncio.get_running_loop())
+        return payload
+
+    dataset = BinaryDataset(filepath=filepath)
+    dataset._fs = MagicMock(async_impl=True, loop=fs_loop)
+    dataset._fs._cat_file = AsyncMock(side_effect=_on_loop)
+    dataset._fs._pipe_file = AsyncMock(side_effect=_on_loop)
+
+    async def _round_trip():
+        await dataset.asave(payload)
+        return await dataset.aload()
+
+    assert asyncio.run(_round_trip()) == payload
+    dataset._fs._pipe_file.assert_awaited_once_with(filepath, payload)
+    dataset._fs._cat_file.assert_awaited_once_with(filepath)
+    assert loops == [fs_loop, fs_loop]
+
+
+def test_latest_pointer(tmp_path, payload):
+    filepath = (tmp_path / "pointed.bin").as_posix()
+    args = {
+        "filepath": filepath,
+        "version": Version(None, None),
+        "load_args": {"latest_pointer": True},
+        "save_args": {"latest_pointer": True},
+    }
+    saver = BinaryDataset(**args)
+    saver.save(payload)
+    versions = [path.name for path in (tmp_path / "pointed.bin").iterdir() if path.is_dir()]
+    assert (tmp_path / "pointed.bin" / "LATEST").read_text() == versions[0]
+
+    dataset = BinaryDataset(**args)
+    with patch.object(dataset._fs, "glob", side_effect=AssertionError("listed")):
+        assert dataset.load() == payload
+
+
+def test_latest_pointer_falls_back_to_listing(tmp_path, payload):
+    filepath = (tmp_path / "listed.bin").as_posix()
+    BinaryDataset(filepath=filepath, version=Version(None, None)).save(payload)
+
+    dataset = BinaryDataset(
+        filepath=filepath, version=Version(None, None), load_args={"latest_pointer": True}
+    )
+
+    assert dataset.load() == payload
+
+
+def test_memoized_version(tmp_path, payload):
+    filepath = (tmp_path / "memoized.bin").as_posix()
+    args = {
+        "filepath": filepath,
+        "version": Version(None, None),
+        "load_args": {"memoize_version": True},
+    }
+    BinaryDataset(**args).save(payload)
+    assert BinaryDataset(**args).load() == payload
+
+    dataset = BinaryDataset(**args)
+    with patch.object(dataset._fs, "glob", side_effect=AssertionError("listed")):
+        assert dataset.load() == payload
+
+
+def test_memoized_version_is_cleared_on_release(tmp_path, payload):
+    filepath = (tmp_path / "memoized.bin").as_posix()
+    args = {
+        "filepath": filepath,
+        "version": Version(None, None),
+        "load_args": {"memoize_version": True},
+    }
+    BinaryDataset(**args).save(payload)
+    dataset = BinaryDataset(**args)
+    dataset.load()
+
+    dataset.release()
+
+    assert dataset._resolved_versions_key not in BinaryDataset._resolved_versions
+    with patch.object(dataset._fs, "glob", wraps=dataset._fs.glob) as glob:
+        assert BinaryDataset(**args).load() == payload
+    glob.assert_called()
+
+
+def test_memoized_version_is_keyed_by_filesystem_options(tmp_path, payload):
+    filepath = (tmp_path / "memoized.bin").as_posix()
+    args = {
+        "filepath": filepath,
+        "version": Version(None, None),
+        "load_args": {"memoize_version": True},
+    }
+    BinaryDataset(**args).save(payload)
+    BinaryDataset(**args).load()
+
+    fs_args = {"auto_mkdir": False}
+    fs = BinaryDataset(**args, fs_args=fs_args)._fs
+    with patch.object(fs, "glob", wraps=fs.glob) as glob:
+        assert BinaryDataset(**args, fs_args=fs_args).load() == payload
+    glob.assert_called()
+
+
+@pytest.mark.parametrize("as_file", [False, True])
+def test_checksum_is_stored_and_verified(filepath, payload, as_file):
+    data = io.BytesIO(payload) if as_file else payload
+    BinaryDataset(filepath=filepath, save_args={"checksum": "sha256"}).save(data)
+
+    with open(f"{filepath}.digest") as digest_file:
+        digest, _ = digest_file.read().split("\n")
+    assert digest == f"sha256:{hashlib.sha256(payload).hexdigest()}"
+    assert BinaryDataset(filepath=filepath, load_args={"verify_checksum": True}).load() == payload
+
+
+@pytest.mark.parametrize("load_args", [{}, {"stream": True}])
+def test_checksum_mismatch(filepath, payload, load_args):
+    BinaryDataset(filepath=filepath, save_args={"checksum": "sha256"}).save(payload)
+    with open(filepath, "r+b") as stored:
+        stored.write(b"corrupted")
+    dataset = BinaryDataset(filepath=filepath, load_args={"verify_checksum": True, **load_args})
+
+    def _read():
+        loaded = dataset.load()
+        return list(loaded) if load_args else loaded
+
+    with pytest.raises(DatasetError, match="Checksum mismatch"):
+        _read()
+
+
+@pytest.mark.parametrize("source", ["bytes", "file", "blocks"])
+def test_iter_parts_rebuffers_to_part_size(payload, source):
+    data = {
+        "bytes": payload,
+        "file": io.BytesIO(payload),
+        "blocks": (payload[i : i + 1000] for i in range(0, len(payload), 1000)),
+    }[source]
+
+    parts = list(_iter_parts(data, 4096))
+
+    assert [len(part) for part in parts] == [4096, 4096, 2048]
+    assert b"".join(parts) == payload
+
+
+def test_multipart_is_ignored_for_local_files(filepath, payload, caplog):
+    dataset = BinaryDataset(filepath=filepath, save_args={"multipart": True})
+    dataset.save(payload)
+
+    assert "'multipart' is only supported" in caplog.text
+    assert dataset.load() == payload
+
+
+def s3_filesystem(uploaded=None, failing=()):
+    """Returns a mock S3 filesystem with a pending upload of ``uploaded`` parts, if given.
+
+    Uploading the parts numbered in ``failing`` raises an ``OSError``.
+    """
+
+    async def call_s3(method, **kwargs):
+        if method == "list_multipart_uploads":
+            pending = [{"Key": "key", "UploadId": "pending", "Initiated": 1}]
+            return {"Uploads": pending if uploaded is not None else []}
+        if method == "list_parts":
+            return {"Parts": [{"PartNumber": n, "ETag": e} for n, e in uploaded.items()]}
+        if method == "create_multipart_upload":
+            return {"UploadId": "created"}
+        if method == "upload_part":
+            if kwargs["PartNumber"] in failing:
+                raise OSError("upload failed")
+            # the later parts finish first
+            await asyncio.sleep(0.01 * (4 - kwargs["PartNumber"]))
+            return {"ETag": f'"{hashlib.md5(kwargs["Body"]).hexdigest()}"'}
+        return {}
+
+    fs = MagicMock()
+    fs.split_path.return_value = ("bucket", "key", None)
+    fs._call_s3 = AsyncMock(side_effect=call_s3)
+    fs._pipe_file = AsyncMock()
+    return fs
+
+
+def s3_calls(fs, method):
+    return [call.kwargs for call in fs._call_s3.call_args_list if call.args[0] == method]
+
+
+def etag(part):
+    return f'"{hashlib.md5(part).hexdigest()}"'
+
+
+def test_s3_multipart_upload_completes_parts_in_order(payload):
+    fs = s3_filesystem()
+    parts = list(_iter_parts(payload, 4096))
+
+    asyncio.run(_upload_parts_s3(fs, "bucket/key", iter(parts), 3, resume=False))
+
+    uploads = s3_calls(fs, "upload_part")
+    assert {upload["PartNumber"]: upload["Body"] for upload in uploads} == {
+        1: parts[0],
+        2: parts[1],
+        3: parts[2],
+    }
+    [completed] = s3_calls(fs, "complete_multipart_upload")
+    assert completed["UploadId"] == "created"
+    assert completed["MultipartUpload"]["Parts"] == [
+        {"PartNumber": n, "ETag": etag(part)} for n, part in enumerate(parts, start=1)
+    ]
+
+
+def test_s3_multipart_upload_resumes_pending_upload(payload):
+    parts = list(_iter_parts(payload, 4096))
+    fs = s3_filesystem(uploaded={1: etag(parts[0]), 2: '"stale"'})
+
+    asyncio.run(_upload_parts_s3(fs, "bucket/key", iter(parts), 3, resume=True))
+
+    assert not s3_calls(fs, "create_multipart_upload")
+    uploads = s3_calls(fs, "upload_part")
+    assert sorted(upload["PartNumber"] for upload in uploads) == [2, 3]
+    assert {upload["UploadId"] for upload in uploads} == {"pending"}
+    [completed] = s3_calls(fs, "complete_multipart_upload")
+    assert [part["PartNumber"] for part in completed["MultipartUpload"]["Parts"]] == [1, 2, 3]
+
+
+def test_s3_multipart_upload_of_empty_payload():
+    fs = s3_filesystem()
+
+    asyncio.run(_upload_parts_s3(fs, "bucket/key", iter([]), 3, resume=True))
+
+    fs._pipe_file.assert_awaited_once_with("bucket/key", b"")
+    fs._call_s3.assert_not_called()
+
+
+class CountingParts:
+    """Iterates over parts, counting the ones read in ``read``."""
+
+    def __init__(self, parts):
+        self._parts = iter(parts)
+        self.read = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        part = next(self._parts)
+        self.read += 1
+        return part
+
+
+def test_s3_multipart_upload_stops_and_aborts_on_failure(payload):
+    parts = list(_iter_parts(payload, 1024))
+    fs = s3_filesystem(failing={2})
+    source = CountingParts(parts)
+
+    with pytest.raises(OSError, match="upload failed"):
+        asyncio.run(_upload_parts_s3(fs, "bucket/key", source, 1, resume=False))
+
+    assert source.read < len(parts)
+    assert [upload["PartNumber"] for upload in s3_calls(fs, "upload_part")] == [1, 2]
+    assert not s3_calls(fs, "complete_multipart_upload")
+    assert s3_calls(fs, "abort_multipart_upload") == [
+        {"Bucket": "bucket", "Key": "key", "UploadId": "created"}
+    ]
+
+
+def test_s3_multipart_upload_keeps_parts_to_resume(payload):
+    parts = list(_iter_parts(payload, 1024))
+    fs = s3_filesystem(failing={2})
+
+    with pytest.raises(OSError, match="upload failed"):
+        asyncio.run(_upload_parts_s3(fs, "bucket/key", iter(parts), 1, resume=True))
+
+    assert not s3_calls(fs, "abort_multipart_upload")
+
+
+def test_multipart_part_size_below_s3_minimum():
+    with patch("fusion_datasets.binary_dataset.get_filesystem"):
+        with pytest.raises(ValueError, match="'part_size' must be at least 5242880 bytes"):
+            BinaryDataset(
+                filepath="s3://bucket/file.bin",
+                save_args={"multipart": True, "part_size": 1024 * 1024},
+            )
+
+
+def azure_filesystem(staged=()):
+    """Returns a mock Azure filesystem and blob client with ``staged`` uncommitted blocks."""
+    client = AsyncMock()
+    client.get_block_list.return_value = ([], [SimpleNamespace(id=i) for i in staged])
+    fs = MagicMock()
+    fs.split_path.return_value = ("container", "blob", None)
+    fs.service_client.get_blob_client.return_value.__aenter__.return_value = client
+    return fs, client
+
+
+def test_azure_block_upload_commits_blocks_in_order(payload):
+    fs, client = azure_filesystem()
+    parts = list(_iter_parts(payload, 4096))
+
+    asyncio.run(_upload_blocks_azure(fs, "container/blob", iter(parts), 3, resume=False))
+
+    staged = {call.args[0]: call.args[1] for call in client.stage_block.call_args_list}
+    [committed] = client.commit_block_list.call_args.args
+    block_ids = [block.id for block in committed]
+    assert sorted(staged) == block_ids
+    assert [staged[block_id] for block_id in block_ids] == parts
+
+
+def test_azure_block_upload_resumes_staged_blocks(payload):
+    parts = list(_iter_parts(payload, 4096))
+    fs, client = azure_filesystem()
+    asyncio.run(_upload_blocks_azure(fs, "container/blob", iter(parts), 3, resume=False))
+    [committed] = client.commit_block_list.call_args.args
+    block_ids = [block.id for block in committed]
+    # the first two blocks were staged by a failed upload
+    fs, client = azure_filesystem(staged=block_ids[:2])
+
+    asyncio.run(_upload_blocks_azure(fs, "container/blob", iter(parts), 3, resume=True))
+
+    client.stage_block.assert_awaited_once_with(block_ids[2], parts[2], length=len(parts[2]))
+    [committed] = client.commit_block_list.call_args.args
+    assert [block.id for block in committed] == block_ids
+
+
+def test_azure_block_upload_stops_on_failure(payload):
+    fs, client = azure_filesystem()
+    client.stage_block.side_effect = [None, OSError("stage failed")]
+    parts = list(_iter_parts(payload, 1024))
+    source = CountingParts(parts)
+
+    with pytest.raises(OSError, match="stage failed"):
+        asyncio.run(_upload_blocks_azure(fs, "container/blob", source, 1, resume=False))
+
+    assert source.read < len(parts)
+    assert client.stage_block.await_count == 2
+    client.commit_block_list.assert_not_called()
+
+
+def test_azure_block_upload_of_empty_payload():
+    fs, client = azure_filesystem()
+
+    asyncio.run(_upload_blocks_azure(fs, "container/blob", iter([]), 3, resume=False))
+
+    client.stage_block.assert_not_called()
+    client.commit_block_list.assert_awaited_once_with([])
+
+
+@pytest.fixture
+def files():
+    return {"a.bin": b"a" * 10, "nested/b.bin": b"b" * 20, "nested/c.txt": b"c"}
+
+
+@pytest.mark.parametrize("protocol", ["file", "memory"])
+def test_batch_save_and_load(tmp_path, files, protocol):
+    path = (tmp_path / "batch").as_posix() if protocol == "file" else "memory:///batch"
+    dataset = BinaryBatchDataset(path=path, load_args={"max_workers": 2})
+
+    dataset.save(files)
+
+    assert dataset.exists()
+    assert dataset.load() == files
+
+
+def test_batch_load_glob(tmp_path, files):
+    root = (tmp_path / "batch").as_posix()
+    BinaryBatchDataset(path=root).save(files)
+
+    loaded = BinaryBatchDataset(path=f"{root}/**/*.bin").load()
+
+    assert loaded == {"a.bin": files["a.bin"], "nested/b.bin": files["nested/b.bin"]}
+
+
+def test_batch_lazy_load(tmp_path, files):
+    root = (tmp_path / "batch").as_posix()
+    BinaryBatchDataset(path=root).save(files)
+
+    loaded = BinaryBatchDataset(path=root, load_args={"lazy": True}).load()
+
+    assert isinstance(loaded, LazyBinaryMapping)
+    assert sorted(loaded) == sorted(files)
+    assert loaded["nested/c.txt"] == b"c"
@@ -0,0 +1,57 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fusion_datasets.binary_dataset import BinaryDataset
+from fusion_datasets.filesystem import clear_filesystems, get_filesystem
+
+
+@pytest.fixture(autouse=True)
+def _clear_filesystems():
+    clear_filesystems()
+    yield
+    clear_filesystems()
+
+
+def filesystems_of_threads(protocol):
+    """Returns the filesystems of ``protocol`` got by 4 threads, and the threads."""
+    threads = []
+
+    def _get_filesystem(_):
+        threads.append(threading.get_ident())
+        time.sleep(0.01)  # keep the thread busy, so each task runs in its own thread
+        return get_filesystem(protocol, fs_args={"skip_instance_cache": True})
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        filesystems = list(executor.map(_get_filesystem, range(4)))
+    return filesystems, threads
+
+
+def test_async_filesystems_are_shared_across_threads():
+    filesystems, _ = filesystems_of_threads("http")
+
+    assert all(fs is filesystems[0] for fs in filesystems)
+
+
+def test_sync_filesystems_are_shared_within_a_thread():
+    filesystems, threads = filesystems_of_threads("memory")
+
+    assert len({id(fs) for fs in filesystems}) == len(set(threads))
+    fs = get_filesystem("memory", fs_args={"skip_instance_cache": True})
+    assert get_filesystem("memory", fs_args={"skip_instance_cache": True}) is fs
+
+
+def test_filesystems_are_keyed_by_options():
+    fs = get_filesystem("file", fs_args={"auto_mkdir": True})
+
+    assert get_filesystem("file", fs_args={"auto_mkdir": True}) is fs
+    assert get_filesystem("file", fs_args={"auto_mkdir": False}) is not fs
+
+
+def test_datasets_share_filesystems(tmp_path):
+    first = BinaryDataset(filepath=(tmp_path / "a.bin").as_posix())
+    second = BinaryDataset(filepath=(tmp_path / "b.bin").as_posix())
+
+    assert first._fs is second._fs
@@ -0,0 +1,49 @@
+import time
+from unittest.mock import patch
+
+import pytest
+
+from fusion_datasets.utils import DirectoryCache, check_installed
+
+
+def test_directory_cache_round_trip(tmp_path):
+    cache = DirectoryCache(str(tmp_path / "cache"), max_bytes=100)
+
+    assert cache.get("a") is None
+    cache.put("a", b"data")
+
+    assert cache.get("a") == b"data"
+    assert [path.name for path in (tmp_path / "cache").iterdir()] == ["a.bin"]
+
+
+def test_directory_cache_evicts_least_recently_used(tmp_path):
+    cache = DirectoryCache(str(tmp_path), max_bytes=2500)
+    for key in ("a", "b"):
+        cache.put(key, b"x" * 1000)
+        time.sleep(0.01)
+    cache.get("a")
+    time.sleep(0.01)
+
+    cache.put("c", b"x" * 1000)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_directory_cache_lists_the_directory_once(tmp_path):
+    cache = DirectoryCache(str(tmp_path), max_bytes=2500)
+
+    with patch.object(cache, "_list_entries", wraps=cache._list_entries) as list_entries:
+        for key in "abcdef":
+            cache.put(key, b"x" * 1000)
+
+    list_entries.assert_called_once()
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["e.bin", "f.bin"]
+
+
+def test_check_installed():
+    check_installed("json", "serializer")
+
+    with pytest.raises(ImportError, match="'checksum' requires the 'not_a_module' package"):
+        check_installed("not_a_module", "checksum")